@@ -9,24 +9,42 @@ from typing import (
     Optional,
     Type,
     TypeVar,
+    Union,
+    get_args,
+    get_origin,
     get_type_hints,
 )
-from quart import Blueprint, request
-from datetime import datetime
+from uuid import UUID
+from quart import Blueprint, current_app, request
 
+from api.abstractEntity.conditionalGet import (
+    isNotModified,
+    makeEtag,
+    notModifiedResponse,
+    setValidators,
+)
+from api.abstractEntity.jsonStream import STREAM_BATCH_SIZE, isJsonStream, streamJsonResponse
+from api.abstractEntity.queryBinder import QueryBinder
 from api.auth.roleChecking import verifyRoles
+from domain.DTOs.bulkItemResultDTO import BulkItemResultDTO
+from domain.DTOs.entityVersionDTO import EntityVersionDTO
+from domain.DTOs.idsDTO import ByIdsResultDTO, IdsDTO
 from domain.abstractEntity.abstractEntity import AbstractEntity
 from domain.abstractEntity.baseEntity import BaseEntity
+from domain.abstractEntity.projection import Projection
 from domain.domainError.domainError import DomainError
 from domain.domainError.domainErrorException import DomainErrorException
 from domain.option.option import Option
 from domain.utility.errorHandling import apiErrorHandling
 from quart_jwt_extended import jwt_required
+from services.abstractService.abstractService import AbstractService
 
 T = TypeVar("T", bound=AbstractEntity)
 R = TypeVar("R", bound=BaseEntity)
 V = TypeVar("V")
 
+VersionLookup = Callable[..., Awaitable[Option[EntityVersionDTO]]]
+
 
 @dataclass
 class RouteConfig(BaseEntity):
@@ -40,19 +58,73 @@ class RouteConfig(BaseEntity):
     outputType: Optional[str]
 
 
+@dataclass
+class RouteHandler:
+    handler: Callable[..., Awaitable[Any]]
+    jwtOptional: bool
+
+
 class AbstractController(Generic[T]):
     entityType: Type[T]
+    service: Optional[Type[AbstractService[T]]]
     blueprint: Blueprint
     routePrefix: str
     controllerName: str
     routeRegistry: List[RouteConfig]
+    routeHandlers: dict[str, RouteHandler]
+
+    maxBulkItems: int = 1000
+    maxByIds: int = 100
 
-    def __init__(self, entityType: Type[T]):
+    def __init__(
+        self,
+        entityType: Type[T],
+        service: Optional[Type[AbstractService[T]]] = None,
+        name: Optional[str] = None,
+        routePrefix: Optional[str] = None,
+    ):
+        # name and routePrefix are for controllers that aren't about a single entity.
+        name = name or entityType.__name__
         self.entityType = entityType
-        self.blueprint = Blueprint(f"{entityType.__name__}Routes", __name__)
-        self.routePrefix = entityType.getRoutePrefix()
-        self.controllerName = f"{entityType.__name__}Controller"
+        self.service = service
+        self.blueprint = Blueprint(f"{name}Routes", __name__)
+        self.routePrefix = routePrefix or entityType.getRoutePrefix()
+        self.controllerName = f"{name}Controller"
         self.routeRegistry = []
+        self.routeHandlers = {}
+        if service is not None:
+            self.defineDefaultRoutes(service)
+
+    def defineDefaultRoutes(self, service: Type[AbstractService[T]]):
+        # Routes every entity with a service gets for free.
+        @self.controllerRoute("/bulk", "Admin", methods=["POST"])
+        async def bulkUpsert() -> Option[list[BulkItemResultDTO]]:
+            entities = await self.deserializeEntities(self.entityType)
+            return await service.upsertMany(entities)
+
+        async def getManyByIds(ids: list[UUID], fields: Optional[Projection] = None):
+            return await service.getByIdsInOrder(self.checkIdCount(ids), fields)
+
+        # For id lists too long for a query string
+        async def postManyByIds(ids: IdsDTO, fields: Optional[Projection] = None):
+            return await service.getByIdsInOrder(self.checkIdCount(ids.ids), fields)
+
+        # Annotated here so the route registry names the concrete entity type.
+        for byIds in (getManyByIds, postManyByIds):
+            byIds.__annotations__["return"] = Option[ByIdsResultDTO[self.entityType]]
+        self.controllerRoute("/by-ids")(getManyByIds)
+        self.controllerRoute("/by-ids", methods=["POST"], entityType=IdsDTO)(postManyByIds)
+
+    def checkIdCount(self, ids: list[UUID]) -> list[UUID]:
+        if len(ids) > self.maxByIds:
+            raise DomainErrorException(
+                DomainError(
+                    f"{self.controllerName}-E04",
+                    f"At most {self.maxByIds} ids can be fetched at once.",
+                    status=400,
+                )
+            )
+        return ids
 
     def addRoute(
         self,
@@ -74,38 +146,98 @@ class AbstractController(Generic[T]):
                     status=400,
                 )
             )
-        return entityType.fromDict(entityData)
+        try:
+            return entityType.fromDict(entityData)
+        except (ValueError, TypeError) as e:
+            raise DomainErrorException(
+                DomainError(
+                    f"{self.controllerName}-E01",
+                    f"Could not deserialize {entityType.__name__}: {e}",
+                    status=400,
+                )
+            )
+
+    async def deserializeEntities(self, entityType: Type[R]) -> list[R]:
+        entityData = await request.json
+        if not isinstance(entityData, list):
+            raise DomainErrorException(
+                DomainError(
+                    f"{self.controllerName}-E02",
+                    f"Expected a list of {entityType.__name__}.",
+                    status=400,
+                )
+            )
+        if len(entityData) > self.maxBulkItems:
+            raise DomainErrorException(
+                DomainError(
+                    f"{self.controllerName}-E03",
+                    f"At most {self.maxBulkItems} items can be sent at once.",
+                    status=400,
+                )
+            )
+        entities = []
+        for index, item in enumerate(entityData):
+            try:
+                if not isinstance(item, dict):
+                    raise TypeError("expected an object")
+                entities.append(entityType.fromDict(item))
+            except (ValueError, TypeError) as e:
+                raise DomainErrorException(
+                    DomainError(
+                        f"{self.controllerName}-E01",
+                        f"Could not deserialize {entityType.__name__} at index {index}: {e}",
+                        status=400,
+                    )
+                )
+        return entities
 
     async def handleRequest(
         self,
         f: Callable[..., Awaitable[Option[V]]],
         entity: Optional[R],
+        binder: QueryBinder,
+        version: Optional[VersionLookup],
+        etag: bool,
+        streamBatchSize: int,
         *args,
         **kwargs,
     ):
-        # Get URL query parameters and attempt to convert numeric strings and dates
-        url_params = {}
-        for key, value in request.args.to_dict().items():
-            try:
-                # Try to convert to int first
-                url_params[key] = int(value)
-            except ValueError:
-                try:
-                    # Try to convert to float if int fails
-                    url_params[key] = float(value)
-                except ValueError:
-                    try:
-                        # Try to parse as ISO date if numeric conversions fail
-                        url_params[key] = datetime.fromisoformat(value.replace('Z', '+00:00'))
-                    except ValueError:
-                        # Keep as string if all conversions fail
-                        url_params[key] = value
-        
+        queryKwargs, projection = binder.bind(request.args)
+
+        # A version lookup lets repeat readers get a 304 before anything is loaded or serialized.
+        conditional = request.method in ("GET", "HEAD")
+        currentVersion = None
+        if conditional and version is not None:
+            currentVersion = (await version(*args, **kwargs)).valueOrDefault()
+            if currentVersion is not None:
+                versionTag = makeEtag(currentVersion.version.encode("utf-8"))
+                if isNotModified(versionTag, currentVersion.lastModified):
+                    return notModifiedResponse(versionTag, currentVersion.lastModified)
+
         if entity is not None:
-            result = await f(entity, *args, **kwargs, **url_params)
+            result = await f(entity, *args, **kwargs, **queryKwargs)
         else:
-            result = await f(*args, **kwargs, **url_params)
-        return result.okOrNotFound()
+            result = await f(*args, **kwargs, **queryKwargs)
+        if projection is not None and result.value is not None:
+            result = Option(projection.apply(result.value, self.entityType))
+
+        streamed = isJsonStream(result.value)
+        if streamed:
+            response = await streamJsonResponse(result.value, streamBatchSize)
+        elif currentVersion is not None or (conditional and etag):
+            response = current_app.json.response(result.okOrNotFound())
+        else:
+            return result.okOrNotFound()
+
+        if currentVersion is not None:
+            setValidators(response, versionTag, currentVersion.lastModified)
+        elif conditional and etag and not streamed:
+            # Without a version the tag comes from the body, which saves bandwidth but not the work.
+            bodyTag = makeEtag(await response.get_data())
+            if isNotModified(bodyTag, None):
+                return notModifiedResponse(bodyTag, None)
+            setValidators(response, bodyTag, None)
+        return response
 
     def createDecoratedFunction(
         self,
@@ -113,6 +245,10 @@ class AbstractController(Generic[T]):
         jwtOptional: bool,
         requiredRoles: list,
         entityType: Optional[Type[R]],
+        binder: QueryBinder,
+        version: Optional[VersionLookup] = None,
+        etag: bool = False,
+        streamBatchSize: int = STREAM_BATCH_SIZE,
     ):
         @wraps(f)
         @apiErrorHandling
@@ -121,8 +257,14 @@ class AbstractController(Generic[T]):
             entity = None
             if entityType:
                 entity = await self.deserializeEntity(entityType)
-            return await self.handleRequest(f, entity, *args, **kwargs)
+            return await self.handleRequest(
+                f, entity, binder, version, etag, streamBatchSize, *args, **kwargs
+            )
 
+        # /batch calls the route without the JWT check, it verifies the token once for all of them.
+        self.routeHandlers[f"{self.blueprint.name}.{f.__name__}"] = RouteHandler(
+            decoratedFunction, jwtOptional
+        )
         if not jwtOptional:
             decoratedFunction = jwt_required(decoratedFunction)
 
@@ -135,11 +277,29 @@ class AbstractController(Generic[T]):
         methods: list[str] = ["GET"],
         jwtOptional=False,
         entityType: Optional[Type[R]] = None,
+        version: Optional[VersionLookup] = None,
+        etag: bool = False,
+        streamBatchSize: int = STREAM_BATCH_SIZE,
         **options: Any,
     ):
+        # version is called with the route's path parameters and answers conditional GETs with a
+        # 304 before the view runs; etag=True instead tags and validates the serialized body.
+        # streamBatchSize is how many items a streamed response writes per chunk.
         def decorator(f: Callable[..., Awaitable[Option[V]]]):
+            typeHints = get_type_hints(f)
+            # Built once here, so requests only look up converters for the parameters they send.
+            binder = QueryBinder(
+                f, self.entityType, self.routePrefix + rule, entityType is not None
+            )
             decoratedFunction = self.createDecoratedFunction(
-                f, jwtOptional, list(requiredRoles), entityType
+                f,
+                jwtOptional,
+                list(requiredRoles),
+                entityType,
+                binder,
+                version,
+                etag,
+                streamBatchSize,
             )
             # Add to the blueprint
             self.addRoute(
@@ -148,7 +308,6 @@ class AbstractController(Generic[T]):
 
             # Add to the registry
             # Extract the return type
-            typeHints = get_type_hints(f)
             returnType = typeHints.get('return')
             
             outputTypeString = None
@@ -158,11 +317,19 @@ class AbstractController(Generic[T]):
                 if hasattr(returnType, '__args__'):
                     try:
                         outputType = returnType.__args__[0]
-                    
-                        if hasattr(outputType, '__args__'):
-                            outputTypeString = f"{outputType.__name__}[{outputType.__args__[0].__name__}]"
-                        else:
-                            outputTypeString = outputType.__name__
+                        outputTypes = (
+                            get_args(outputType)
+                            if get_origin(outputType) == Union
+                            else (outputType,)
+                        )
+
+                        outputTypeNames = []
+                        for outputType in outputTypes:
+                            if hasattr(outputType, '__args__'):
+                                outputTypeNames.append(f"{outputType.__name__}[{outputType.__args__[0].__name__}]")
+                            else:
+                                outputTypeNames.append(outputType.__name__)
+                        outputTypeString = " | ".join(outputTypeNames)
                     except Exception as e:
                         print(e)
                     
@@ -0,0 +1,38 @@
+import hashlib
+from datetime import datetime, timezone
+from typing import Optional
+
+from quart import Response, request
+
+
+def makeEtag(version: bytes) -> str:
+    # The query string is part of the tag, so pages and ?fields= projections are validated separately.
+    return hashlib.blake2b(version + b"?" + request.query_string, digest_size=16).hexdigest()
+
+
+def _httpDate(value: Optional[datetime]) -> Optional[datetime]:
+    # Stored dates are naive UTC; HTTP dates only have whole seconds.
+    if value is None:
+        return None
+    return value.replace(tzinfo=value.tzinfo or timezone.utc, microsecond=0)
+
+
+def isNotModified(etag: str, lastModified: Optional[datetime]) -> bool:
+    # If-Modified-Since only counts when the client didn't send If-None-Match (RFC 9110 13.1.3).
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    ifModifiedSince = request.if_modified_since
+    lastModified = _httpDate(lastModified)
+    return ifModifiedSince is not None and lastModified is not None and lastModified <= ifModifiedSince
+
+
+def setValidators(response: Response, etag: str, lastModified: Optional[datetime]):
+    response.set_etag(etag)
+    if lastModified is not None:
+        response.last_modified = _httpDate(lastModified)
+
+
+def notModifiedResponse(etag: str, lastModified: Optional[datetime]) -> Response:
+    response = Response(b"", status=304)
+    setValidators(response, etag, lastModified)
+    return response
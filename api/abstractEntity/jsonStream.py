@@ -0,0 +1,54 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
+from quart import Response, g, stream_with_context
+from quart.globals import app_ctx
+
+from domain.domainError.domainError import DomainError
+from domain.logging.logger import Logger
+from domain.utility.jsonEncoder import encodeJson
+
+# Entities serialized per chunk written to the client.
+STREAM_BATCH_SIZE = 100
+
+
+def isJsonStream(value: Any) -> bool:
+    return isinstance(value, AsyncIterator)
+
+
+async def streamJsonResponse(
+    items: AsyncIterator[Any], batchSize: int = STREAM_BATCH_SIZE
+) -> Response:
+    """
+    Writes items as a JSON array in chunks as they come off the iterator, so only one batch is
+    ever held in memory. The first item is pulled before responding, so a failing query still gets
+    a proper error status; a failure after that truncates the body, leaving the array unterminated.
+    """
+    try:
+        first = await items.__anext__()
+    except StopAsyncIteration:
+        return Response(b"[]", mimetype="application/json")
+
+    requestGlobals = g._get_current_object()
+
+    @stream_with_context
+    async def body():
+        # stream_with_context pushes a fresh app context, and with it an empty g; the rest of the
+        # items still need the request's verified token and per-request caches.
+        app_ctx.g = requestGlobals
+        yield b"[" + encodeJson(first)
+        batch: list[bytes] = []
+        try:
+            async for item in items:
+                batch.append(encodeJson(item))
+                if len(batch) >= batchSize:
+                    yield b"," + b",".join(batch)
+                    batch = []
+        except Exception as e:
+            Logger.error(DomainError("JsonStream-E00", "JSON stream interrupted", e, 500))
+            return
+        if batch:
+            yield b"," + b",".join(batch)
+        yield b"]"
+
+    return Response(body(), mimetype="application/json")
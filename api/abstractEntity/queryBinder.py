@@ -0,0 +1,168 @@
+import inspect
+import re
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Optional, Type, Union, get_args, get_origin, get_type_hints
+from uuid import UUID
+
+from werkzeug.datastructures import MultiDict
+
+from domain.abstractEntity.abstractEntity import AbstractEntity
+from domain.abstractEntity.projection import PROJECTION_PARAMETER, Projection
+from domain.domainError.domainErrorException import DomainErrorException
+from domain.pagination.page import PAGE_PARAMETERS, PageRequest
+
+MAX_QUERY_VALUE_LENGTH = 1024
+# Enough for 100 comma-separated UUIDs
+MAX_QUERY_LIST_LENGTH = 4096
+
+_PATH_PARAMETER = re.compile(r"<(?:[^<>:]+:)?([^<>:]+)>")
+_TRUE_VALUES = frozenset({"true", "1", "yes"})
+_FALSE_VALUES = frozenset({"false", "0", "no"})
+
+
+def _parseBool(value: str) -> bool:
+    lowered = value.lower()
+    if lowered in _TRUE_VALUES:
+        return True
+    if lowered in _FALSE_VALUES:
+        return False
+    raise ValueError(value)
+
+
+def _parseDatetime(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+# Query string value -> (converter, what the value must look like, for the 400 message)
+_CONVERTERS: dict[Any, tuple[Callable[[str], Any], str]] = {
+    str: (str, "a string"),
+    int: (int, "an integer"),
+    float: (float, "a number"),
+    bool: (_parseBool, "true or false"),
+    datetime: (_parseDatetime, "an ISO 8601 date"),
+    UUID: (UUID, "a UUID"),
+}
+
+
+def _unwrapOptional(hint: Any) -> Any:
+    if get_origin(hint) == Union:
+        return next((t for t in get_args(hint) if t is not type(None)), hint)
+    return hint
+
+
+def _listConverter(parse: Callable[[str], Any]) -> Callable[[str], list[Any]]:
+    return lambda value: [parse(item.strip()) for item in value.split(",") if item.strip()]
+
+
+def _converterFor(hint: Any) -> tuple[Callable[[str], Any], str]:
+    # list[X] is a comma-separated list: ?ids=a,b,c
+    if get_origin(hint) is list and len(get_args(hint)) == 1:
+        parse, expected = _converterFor(get_args(hint)[0])
+        return _listConverter(parse), f"a comma-separated list of values that are each {expected}"
+    if hint is inspect.Parameter.empty or hint is Any:
+        return _CONVERTERS[str]
+    if hint in _CONVERTERS:
+        return _CONVERTERS[hint]
+    if isinstance(hint, type) and issubclass(hint, Enum):
+        return hint, f"one of {', '.join(str(member.value) for member in hint)}"
+    raise TypeError(f"Query parameters of type {hint} are not supported.")
+
+
+class QueryBinder:
+    """
+    Binds the query string of a route to its view function's keyword arguments. The signature is
+    read once when the route is registered: path parameters and the request body are left alone,
+    a PageRequest or Projection parameter is filled from limit/after/before and ?fields=, and every
+    other parameter gets a converter for its annotated type. Unknown, repeated, oversized and
+    malformed values are rejected with a 400 before the view runs.
+    """
+
+    def __init__(
+        self,
+        f: Callable[..., Any],
+        entityType: Type[AbstractEntity],
+        rule: str,
+        hasBody: bool,
+    ):
+        self.entityType = entityType
+        self.pageParameter: Optional[str] = None
+        self.projectionParameter: Optional[str] = None
+        self.parameters: dict[str, tuple[Callable[[str], Any], str]] = {}
+        self.maxLengths: dict[str, int] = {}
+        self.required: list[str] = []
+
+        typeHints = get_type_hints(f)
+        pathParameters = set(_PATH_PARAMETER.findall(rule))
+        signatureParameters = list(inspect.signature(f).parameters.values())
+        if hasBody:
+            # The deserialized body is passed positionally as the first argument.
+            signatureParameters = signatureParameters[1:]
+
+        for parameter in signatureParameters:
+            name = parameter.name
+            if name in pathParameters or parameter.kind in (
+                inspect.Parameter.VAR_POSITIONAL,
+                inspect.Parameter.VAR_KEYWORD,
+            ):
+                continue
+            hint = _unwrapOptional(typeHints.get(name, parameter.annotation))
+            if hint is PageRequest:
+                self.pageParameter = name
+                continue
+            if hint is Projection:
+                self.projectionParameter = name
+                continue
+            self.parameters[name] = _converterFor(hint)
+            if get_origin(hint) is list:
+                self.maxLengths[name] = MAX_QUERY_LIST_LENGTH
+            if parameter.default is inspect.Parameter.empty:
+                self.required.append(name)
+
+        # ?fields= trims the result of every route, not only the ones that push it down to Mongo.
+        reserved = {PROJECTION_PARAMETER}
+        if self.pageParameter is not None:
+            reserved.update(PAGE_PARAMETERS)
+        self.reserved = frozenset(reserved)
+
+    def bind(self, args: MultiDict) -> tuple[dict[str, Any], Optional[Projection]]:
+        kwargs: dict[str, Any] = {}
+        for name, values in args.lists():
+            if len(values) > 1:
+                raise DomainErrorException.new(
+                    "QueryParameter-E02", f"Query parameter {name} can only be given once."
+                )
+            value = values[0]
+            maxLength = self.maxLengths.get(name, MAX_QUERY_VALUE_LENGTH)
+            if len(value) > maxLength:
+                raise DomainErrorException.new(
+                    "QueryParameter-E03",
+                    f"Query parameter {name} is longer than {maxLength} characters.",
+                )
+            if name in self.reserved:
+                continue
+            converter = self.parameters.get(name)
+            if converter is None:
+                raise DomainErrorException.new(
+                    "QueryParameter-E01", f"Unknown query parameter {name}."
+                )
+            parse, expected = converter
+            try:
+                kwargs[name] = parse(value)
+            except ValueError:
+                raise DomainErrorException.new(
+                    "QueryParameter-E04", f"Query parameter {name} must be {expected}."
+                )
+
+        for name in self.required:
+            if name not in kwargs:
+                raise DomainErrorException.new(
+                    "QueryParameter-E05", f"Query parameter {name} is required."
+                )
+
+        if self.pageParameter is not None:
+            kwargs[self.pageParameter] = PageRequest.fromArgs(args)
+        projection = Projection.fromArgs(self.entityType, args)
+        if self.projectionParameter is not None:
+            kwargs[self.projectionParameter] = projection
+        return kwargs, projection
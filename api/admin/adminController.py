@@ -0,0 +1,37 @@
+from api.abstractEntity.abstractController import AbstractController
+from domain.DTOs.commandStatsDTO import CommandStatsDTO, SlowCommandDTO
+from domain.DTOs.connectionPoolStatsDTO import ConnectionPoolStatsDTO
+from domain.DTOs.entityCacheStatsDTO import EntityCacheStatsDTO
+from domain.DTOs.passwordHashingStatsDTO import PasswordHashingStatsDTO
+from domain.abstractEntity.abstractEntity import AbstractEntity
+from domain.option.option import Option
+from services.auth.authService import AuthService
+from services.caching.cacheService import CacheService
+from services.database.databaseService import DatabaseService
+
+
+class AdminController(AbstractController[AbstractEntity]):
+    def __init__(self):
+        super().__init__(AbstractEntity, name="Admin", routePrefix="/admin")
+        self.defineRoutes()
+
+    def defineRoutes(self):
+        @self.controllerRoute("/db/pool", "Admin")
+        async def getConnectionPoolStats() -> Option[ConnectionPoolStatsDTO]:
+            return await DatabaseService.poolStats()
+
+        @self.controllerRoute("/db/commands", "Admin")
+        async def getCommandStats() -> Option[list[CommandStatsDTO]]:
+            return await DatabaseService.commandStats()
+
+        @self.controllerRoute("/db/slow-commands", "Admin")
+        async def getSlowCommands() -> Option[list[SlowCommandDTO]]:
+            return await DatabaseService.slowCommands()
+
+        @self.controllerRoute("/auth/hashing", "Admin")
+        async def getPasswordHashingStats() -> Option[PasswordHashingStatsDTO]:
+            return await AuthService.hashingStats()
+
+        @self.controllerRoute("/cache", "Admin")
+        async def getCacheStats() -> Option[list[EntityCacheStatsDTO]]:
+            return await CacheService.stats()
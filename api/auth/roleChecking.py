@@ -9,14 +9,14 @@ from services.users.userService import UserService
 
 
 def verifyRoles(requiredRoles: list[str]):
+    requiredRoleSet = frozenset(requiredRoles)
+
     def decorator(f):
         @wraps(f)
         async def decoratedFunction(*args, **kwargs):
-            if len(requiredRoles) == 0:
+            if not requiredRoleSet:
                 return await f(*args, **kwargs)
-            identity = UserProvider.identity()
-            roles = identity.roles if identity is not None else []
-            if not any((role in roles for role in requiredRoles)):
+            if requiredRoleSet.isdisjoint(UserProvider.roleSet()):
                 return Option.Error(
                     DomainError(
                         "AuthCheck-E00",
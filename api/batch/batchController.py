@@ -0,0 +1,120 @@
+import asyncio
+from quart import Response, current_app, request
+from quart_jwt_extended import get_jwt_identity, verify_jwt_in_request_optional
+from werkzeug.datastructures import Headers
+from werkzeug.exceptions import HTTPException
+
+from api.abstractEntity.abstractController import AbstractController
+from domain.DTOs.batchRequestDTO import BatchRequestDTO, BatchResponseDTO
+from domain.abstractEntity.abstractEntity import AbstractEntity
+from domain.domainError.domainError import DomainError
+from domain.option.option import Option
+from domain.utility.jsonEncoder import encodeJson
+
+MAX_BATCH_REQUESTS = 20
+READ_METHODS = frozenset({"GET", "HEAD"})
+
+
+async def _noPushPromise(path: str, headers: Headers):
+    pass
+
+
+class BatchController(AbstractController[AbstractEntity]):
+    """
+    POST /batch takes a list of {method, path, body} sub-requests and runs them in-process against
+    the other controllers' routes, answering with one list of {status, body}. The token is
+    verified once and every sub-request shares the identity and the request's entity loaders.
+    Consecutive reads run concurrently; each write runs alone, in order, so later sub-requests see
+    its effects.
+    """
+
+    maxBulkItems = MAX_BATCH_REQUESTS
+
+    def __init__(self, controllers: list[AbstractController]):
+        super().__init__(AbstractEntity, name="Batch", routePrefix="/batch")
+        self.handlers = {
+            endpoint: routeHandler
+            for controller in controllers
+            for endpoint, routeHandler in controller.routeHandlers.items()
+        }
+        self.defineRoutes()
+
+    def defineRoutes(self):
+        @self.controllerRoute("", methods=["POST"], jwtOptional=True)
+        async def batch() -> Option[list[BatchResponseDTO]]:
+            subRequests = await self.deserializeEntities(BatchRequestDTO)
+            await verify_jwt_in_request_optional()
+            return Option(await self.dispatchAll(subRequests))
+
+    async def dispatchAll(self, subRequests: list[BatchRequestDTO]) -> Response:
+        bodies: list[bytes] = []
+        reads: list[BatchRequestDTO] = []
+        for subRequest in subRequests:
+            if subRequest.method.upper() in READ_METHODS:
+                reads.append(subRequest)
+                continue
+            bodies.extend(await asyncio.gather(*(self.dispatch(read) for read in reads)))
+            reads = []
+            bodies.append(await self.dispatch(subRequest))
+        bodies.extend(await asyncio.gather(*(self.dispatch(read) for read in reads)))
+        return Response(b"[" + b",".join(bodies) + b"]", mimetype="application/json")
+
+    async def dispatch(self, subRequest: BatchRequestDTO) -> bytes:
+        method = subRequest.method.upper()
+        path, _, queryString = subRequest.path.partition("?")
+        if path.startswith(self.routePrefix):
+            return self._result(400, "Batch-E01", "Batch requests can't be nested.")
+
+        body = b"" if subRequest.body is None else encodeJson(subRequest.body)
+        headers = Headers({"Host": request.host, "Content-Type": "application/json"})
+        headers["Content-Length"] = str(len(body))
+        scope = {
+            **request.scope,
+            "method": method,
+            "path": path,
+            "raw_path": path.encode("utf-8"),
+            "query_string": queryString.encode("utf-8"),
+        }
+        subRequestObject = current_app.request_class(
+            method,
+            request.scheme,
+            path,
+            queryString.encode("utf-8"),
+            headers,
+            request.root_path,
+            request.http_version,
+            scope,  # type: ignore
+            send_push_promise=_noPushPromise,
+        )
+        subRequestObject.body.set_result(body)
+
+        # The sub-request context reuses this request's app context, so g, with the decoded
+        # token and the entity loaders, is shared.
+        async with current_app.request_context(subRequestObject):
+            if request.routing_exception is not None:
+                exception = request.routing_exception
+                status = exception.code if isinstance(exception, HTTPException) else 400
+                return self._result(status or 400, "Batch-E02", f"No route for {method} {path}.")
+            routeHandler = self.handlers.get(request.url_rule.endpoint)
+            if routeHandler is None:
+                return self._result(404, "Batch-E02", f"No route for {method} {path}.")
+            if not routeHandler.jwtOptional and get_jwt_identity() is None:
+                return self._result(401, "Batch-E03", "Missing Authorization Header.")
+            response = await current_app.make_response(
+                await routeHandler.handler(**(request.view_args or {}))
+            )
+            return await self._responseResult(response)
+
+    async def _responseResult(self, response: Response) -> bytes:
+        data = await response.get_data()
+        if not data:
+            responseBody = b"null"
+        elif response.mimetype == "application/json":
+            responseBody = data
+        else:
+            responseBody = encodeJson(data.decode("utf-8", "replace"))
+        return b'{"status":%d,"body":%s}' % (response.status_code, responseBody)
+
+    def _result(self, status: int, errorCode: str, message: str) -> bytes:
+        error = DomainError(errorCode, message, status=status)
+        return encodeJson(BatchResponseDTO(status, error.toDict()))
@@ -0,0 +1,155 @@
+import os
+import zlib
+from collections import OrderedDict
+from typing import AsyncIterator, Callable, Optional
+
+from quart import Quart, Response, request
+from quart.wrappers.response import IterableBody
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = frozenset(
+    {"application/json", "application/javascript", "image/svg+xml"}
+)
+
+
+def _intSetting(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+def availableEncodings() -> list[str]:
+    # In order of preference when the client accepts several with the same weight.
+    return (["br"] if brotli is not None else []) + ["gzip"]
+
+
+class _Compressor:
+    # Same interface for both encodings: compress a chunk, flush what's buffered, finish the stream.
+    def __init__(self, encoding: str, level: int):
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=level)
+            self.compress: Callable[[bytes], bytes] = self._brotli.process
+            self.flush: Callable[[], bytes] = self._brotli.flush
+            self.finish: Callable[[], bytes] = self._brotli.finish
+        else:
+            # wbits 31 writes a gzip header and trailer around the deflate stream.
+            self._zlib = zlib.compressobj(level, zlib.DEFLATED, 31)
+            self.compress = self._zlib.compress
+            self.flush = lambda: self._zlib.flush(zlib.Z_SYNC_FLUSH)
+            self.finish = self._zlib.flush
+
+
+class ResponseCompression:
+    """
+    Compresses JSON and text responses with brotli or gzip, whichever the client prefers in
+    Accept-Encoding. Bodies under COMPRESSION_MIN_BYTES go out as they are. Streamed responses are
+    compressed chunk by chunk and flushed after each one, so clients still get every batch as soon
+    as it is written.
+
+    Bodies that carry an ETag are compressed once per tag and encoding. The compressed bytes are
+    kept in a small LRU cache, so unchanged payloads like the entity templates are never compressed
+    twice. Compressed responses get a weak ETag, which 304s still match.
+    """
+
+    def __init__(
+        self,
+        minimumSize: int = 1024,
+        gzipLevel: int = 6,
+        brotliQuality: int = 4,
+        cacheSize: int = 256,
+        maxCachedBytes: int = 1024 * 1024,
+    ):
+        self.minimumSize = minimumSize
+        self.levels = {"gzip": gzipLevel, "br": brotliQuality}
+        self.cacheSize = cacheSize
+        self.maxCachedBytes = maxCachedBytes
+        self.encodings = availableEncodings()
+        self._cache: OrderedDict[tuple[str, str, str], bytes] = OrderedDict()
+
+    @classmethod
+    def fromEnvironment(cls) -> "ResponseCompression":
+        return cls(
+            minimumSize=_intSetting("COMPRESSION_MIN_BYTES", 1024),
+            gzipLevel=_intSetting("COMPRESSION_GZIP_LEVEL", 6),
+            brotliQuality=_intSetting("COMPRESSION_BROTLI_QUALITY", 4),
+            cacheSize=_intSetting("COMPRESSION_CACHE_SIZE", 256),
+            maxCachedBytes=_intSetting("COMPRESSION_CACHE_MAX_BYTES", 1024 * 1024),
+        )
+
+    def register(self, app: Quart):
+        app.after_request(self.compressResponse)
+
+    def _isCompressible(self, response: Response) -> bool:
+        if response.status_code < 200 or response.status_code in (204, 304):
+            return False
+        if "Content-Encoding" in response.headers or "no-transform" in response.cache_control:
+            return False
+        mimetype = response.mimetype or ""
+        return mimetype.startswith("text/") or mimetype in COMPRESSIBLE_MIMETYPES
+
+    async def compressResponse(self, response: Response) -> Response:
+        if not self._isCompressible(response):
+            return response
+        response.vary.add("Accept-Encoding")
+        encoding = request.accept_encodings.best_match(self.encodings)
+        if encoding is None:
+            return response
+
+        if isinstance(response.response, IterableBody):
+            # Length unknown up front, so streams are always compressed.
+            response.response = IterableBody(
+                self._compressStream(response.response, _Compressor(encoding, self.levels[encoding]))
+            )
+            response.headers.pop("Content-Length", None)
+        else:
+            body = await response.get_data()
+            if len(body) < self.minimumSize:
+                return response
+            response.set_data(self._compressBody(body, encoding, response))
+
+        response.headers["Content-Encoding"] = encoding
+        etag, weak = response.get_etag()
+        if etag is not None and not weak:
+            # The compressed bytes differ from the identity body, so the tag can only be weak.
+            response.set_etag(etag, weak=True)
+        return response
+
+    def _compressBody(self, body: bytes, encoding: str, response: Response) -> bytes:
+        etag, _ = response.get_etag()
+        if etag is None or len(body) > self.maxCachedBytes:
+            return self._compress(body, encoding)
+
+        key = (request.path, etag, encoding)
+        compressed = self._cache.get(key)
+        if compressed is not None:
+            self._cache.move_to_end(key)
+            return compressed
+        compressed = self._cache[key] = self._compress(body, encoding)
+        if len(self._cache) > self.cacheSize:
+            self._cache.popitem(last=False)
+        return compressed
+
+    def _compress(self, body: bytes, encoding: str) -> bytes:
+        compressor = _Compressor(encoding, self.levels[encoding])
+        return compressor.compress(body) + compressor.finish()
+
+    async def _compressStream(
+        self, body: IterableBody, compressor: _Compressor
+    ) -> AsyncIterator[bytes]:
+        async with body:
+            async for chunk in body:
+                compressed = compressor.compress(chunk) + compressor.flush()
+                if compressed:
+                    yield compressed
+        yield compressor.finish()
+
+
+def addCompression(app: Quart) -> Optional[ResponseCompression]:
+    if os.environ.get("COMPRESSION_ENABLED", "true").lower() != "true":
+        return None
+    compression = ResponseCompression.fromEnvironment()
+    compression.register(app)
+    return compression
@@ -1,29 +1,44 @@
+from typing import AsyncGenerator, Optional, Union
 from uuid import UUID
 from api.abstractEntity.abstractController import AbstractController
+from domain.abstractEntity.projection import Projection
 from domain.DTOs.stringDTO import StringDTO
 from domain.option.option import Option
+from domain.pagination.page import Page, PageRequest
 from domain.imageGenerations.imageGeneration import ImageGeneration
 from services.imageGenerations.imageGenerationService import ImageGenerationService
 
 class ImageGenerationController(AbstractController[ImageGeneration]):
     def __init__(self):
-        super().__init__(ImageGeneration)
+        super().__init__(ImageGeneration, ImageGenerationService)
         self.defineRoutes()
 
 
     def defineRoutes(self):
-        @self.controllerRoute("/<string:imageGenerationId>")
-        async def getImageGenerationById(imageGenerationId: str) -> Option[ImageGeneration]:
-            result = await ImageGenerationService.getById(UUID(imageGenerationId))
+        @self.controllerRoute(
+            "/<string:imageGenerationId>",
+            version=lambda imageGenerationId: ImageGenerationService.getVersion(
+                UUID(imageGenerationId)
+            ),
+        )
+        async def getImageGenerationById(
+            imageGenerationId: str, fields: Optional[Projection] = None
+        ) -> Option[ImageGeneration]:
+            result = await ImageGenerationService.getById(UUID(imageGenerationId), fields)
             return result
 
-        @self.controllerRoute("/all")
-        async def getAllImageGenerations() -> Option[list[ImageGeneration]]:
-            result = await ImageGenerationService.getAll()
-            return result
+        @self.controllerRoute("/all", version=ImageGenerationService.getCollectionVersion)
+        async def getAllImageGenerations(
+            page: Optional[PageRequest] = None,
+            fields: Optional[Projection] = None,
+        ) -> Option[Union[AsyncGenerator[ImageGeneration, None], Page[ImageGeneration]]]:
+            if page is not None:
+                return await ImageGenerationService.getPage(page, projection=fields)
+            # Unpaginated, the whole collection is streamed instead of built up in memory.
+            return await ImageGenerationService.getAllGenerator(projection=fields)
 
 
-        @self.controllerRoute("/template")
+        @self.controllerRoute("/template", etag=True)
         async def getImageGenerationTemplate():
             result = Option(ImageGeneration.getTemplate())
             return result
@@ -34,8 +49,11 @@ class ImageGenerationController(AbstractController[ImageGeneration]):
             result = await ImageGenerationService.upsert(imageGeneration)
             return result
         
-        @self.controllerRoute("/generate", methods=["POST"], entityType=StringDTO)
-        async def generateImages(prompt: StringDTO, ratio: str = "1:1", n: int = 3) -> Option[list[ImageGeneration]]:
+        # Streamed one image per chunk, so each reaches the client as soon as it's ready.
+        @self.controllerRoute("/generate", methods=["POST"], entityType=StringDTO, streamBatchSize=1)
+        async def generateImages(
+            prompt: StringDTO, ratio: str = "1:1", n: int = 3
+        ) -> Option[AsyncGenerator[ImageGeneration, None]]:
             return await ImageGenerationService.generateImages(prompt.value, ratio, n)
 
 
@@ -1,25 +1,31 @@
-import json
+from typing import Any
 from quart import Quart
 from api.abstractEntity.abstractController import AbstractController
+from api.admin.adminController import AdminController
 from api.auth.authController import AuthController
+from api.batch.batchController import BatchController
 from api.users.userController import UserController
 from api.imageGenerations.imageGenerationController import ImageGenerationController
 
 
-def addRoutes(app: Quart):
+def addRoutes(app: Quart) -> list[AbstractController]:
     controllers: list[AbstractController] = [
         UserController(),
         AuthController(),
         ImageGenerationController(),
+        AdminController(),
     ]
+    controllers.append(BatchController(controllers))
 
     for controller in controllers:
         app.register_blueprint(controller.blueprint)
 
-    registryData = [
+    return controllers
+
+
+def routeRegistry(controllers: list[AbstractController]) -> list[dict[str, Any]]:
+    # Exported by tools/exportRegistry.py for the Postman and TypeScript generators.
+    return [
         {controller.controllerName: [r.toDict() for r in controller.routeRegistry]}
         for controller in controllers
     ]
-    with open("registry.json", "w") as f:
-        jsonString = json.dumps(registryData, indent=4)
-        f.write(jsonString)
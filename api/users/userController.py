@@ -1,7 +1,8 @@
 from datetime import timedelta
-from typing import Any
+from typing import Any, Optional
 from uuid import UUID
 from api.abstractEntity.abstractController import AbstractController
+from domain.abstractEntity.projection import Projection
 from domain.DTOs.stringDTO import StringDTO
 from domain.domainError.domainErrorException import DomainErrorException
 from domain.option.option import Option
@@ -15,33 +16,50 @@ from quart import request
 
 class UserController(AbstractController[User]):
     def __init__(self):
-        super().__init__(User)
+        super().__init__(User, UserService)
         self.defineRoutes()
 
     def defineRoutes(self):
-        @self.controllerRoute("/<string:userId>", methods=["GET"])
-        async def getUserById(userId: str) -> Option[User]:
-            result = await UserService.getById(UUID(userId))
+        @self.controllerRoute(
+            "/<string:userId>",
+            methods=["GET"],
+            version=lambda userId: UserService.getVersion(UUID(userId)),
+        )
+        async def getUserById(userId: str, fields: Optional[Projection] = None) -> Option[User]:
+            result = await UserService.getById(UUID(userId), fields)
+            identity = UserProvider.identity()
+            if result.isError() and identity is not None and identity.isGuest and identity.id == UUID(userId):
+                # The caller is a guest that hasn't been written yet.
+                return Option(UserService.guestUser(identity))
             return result
 
         @self.controllerRoute("", methods=["POST"], jwtOptional=True)
         async def createUser() -> Option[Any]:
-            # First, make the user.
-            userOptional = await UserService.createUser()
+            # First, make the guest. It's only written to the database once it changes something.
+            userOptional = await UserService.createGuest()
             user = userOptional.valueOrThrow()
 
             # Give them a token
             accessToken = create_access_token(
-                identity=UserIdentity(user.id, user.roles).toDict(),
+                identity=UserService.guestIdentity(user).toDict(True),
                 expires_delta=False,
             )
 
             return Option({"access_token": accessToken, "user": user.toDict()})
         
         @self.controllerRoute("/verify", methods=["POST"], entityType=User)
-        async def verifyUser(user: User) -> Option[User]:
+        async def verifyUser(user: User) -> Option[Any]:
             userId = UserProvider.userId()
-            return await UserService.verifyUser(userId, user.email, user.username, user.password)
+            verifiedUser = (
+                await UserService.verifyUser(userId, user.email, user.username, user.password)
+            ).valueOrThrow()
+
+            # The guest token would keep every later write checking for an unwritten guest.
+            accessToken = create_access_token(
+                identity=UserIdentity(verifiedUser.id, verifiedUser.roles).toDict(),
+                expires_delta=False,
+            )
+            return Option({"access_token": accessToken, "user": verifiedUser.toDict()})
 
         @self.controllerRoute("/add-role", "Admin", methods=["POST"])
         async def addUserRole() -> Option[User]:
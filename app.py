@@ -1,15 +1,50 @@
+import os
 from quart import Quart
 from quart_cors import cors
 from quart_jwt_extended import JWTManager
+from api.compression.responseCompression import addCompression
 from api.routing import addRoutes
+from domain.utility.auth import passwordHashingPool
+from domain.utility.jsonEncoder import OrjsonProvider
+from persistence.dbClient import DatabaseClient
+from services.indexes.indexService import IndexService
 
 app = Quart(__name__)
+app.json = OrjsonProvider(app)
 app = cors(app, allow_origin="*")
 
 app.config["JWT_SECRET_KEY"] = "supersecretz"
 jwt = JWTManager(app)
 
 addRoutes(app)
+addCompression(app)
+
+
+@app.before_serving
+async def connectDatabase():
+    await DatabaseClient.connect()
+
+
+@app.after_serving
+async def closeDatabase():
+    DatabaseClient.close()
+
+
+@app.after_serving
+async def closePasswordHashingPool():
+    passwordHashingPool.close()
+
+
+@app.before_serving
+async def reconcileIndexes():
+    # Only creates missing indexes, which every worker can do at once. Indexes whose options
+    # changed are logged and left for tools/reconcileIndexes.py, run once per deploy.
+    if os.environ.get("DB_RECONCILE_INDEXES", "true").lower() == "true":
+        result = await IndexService.reconcileAll()
+        result.valueOrDefault(log=True)
+    # Refuse to serve without the unique indexes, whether or not this worker reconciled.
+    (await IndexService.ensureUniqueIndexes()).valueOrThrow()
+
 
 if __name__ == "__main__":
     app.run(debug=False)
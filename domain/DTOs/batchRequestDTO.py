@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from domain.abstractEntity.baseEntity import BaseEntity
+
+
+@dataclass
+class BatchRequestDTO(BaseEntity):
+    method: str
+    path: str
+    body: Optional[Any]
+
+
+@dataclass
+class BatchResponseDTO(BaseEntity):
+    status: int
+    body: Optional[Any]
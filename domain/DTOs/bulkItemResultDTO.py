@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from domain.abstractEntity.baseEntity import BaseEntity
+
+
+@dataclass
+class BulkItemResultDTO(BaseEntity):
+    index: int
+    id: UUID
+    success: bool
+    error: Optional[str]
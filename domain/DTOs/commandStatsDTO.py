@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from domain.abstractEntity.baseEntity import BaseEntity
+
+
+@dataclass
+class QueryShapeStatsDTO(BaseEntity):
+    shape: str
+    count: int
+    totalMs: float
+    maxMs: float
+
+
+@dataclass
+class CommandStatsDTO(BaseEntity):
+    collection: str
+    operation: str
+    count: int
+    failures: int
+    totalMs: float
+    averageMs: float
+    maxMs: float
+    documents: int
+    bytes: int
+    # Upper bound in ms ("inf" for the last bucket) -> number of commands that took at most that long.
+    histogram: dict[str, int]
+    shapes: list[QueryShapeStatsDTO]
+
+
+@dataclass
+class SlowCommandDTO(BaseEntity):
+    timestamp: datetime
+    collection: str
+    operation: str
+    shape: str
+    durationMs: float
+    documents: int
+    explainStages: Optional[list[str]]
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+from domain.abstractEntity.baseEntity import BaseEntity
+
+
+@dataclass
+class ConnectionPoolStatsDTO(BaseEntity):
+    maxPoolSize: int
+    minPoolSize: int
+    connectionsOpen: int
+    connectionsCreated: int
+    connectionsClosed: int
+    checkedOut: int
+    waitQueueLength: int
+    maxWaitQueueLength: int
+    checkouts: int
+    checkoutFailures: dict[str, int]
+    averageWaitMs: float
+    maxWaitMs: float
+    poolClears: int
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+from domain.abstractEntity.baseEntity import BaseEntity
+from domain.caching.entityCache import CacheStats
+
+
+@dataclass
+class EntityCacheStatsDTO(BaseEntity):
+    entityType: str
+    stats: CacheStats
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from domain.abstractEntity.baseEntity import BaseEntity
+from domain.utility.dateExtension import toMongoPrecision
+
+
+@dataclass
+class EntityVersionDTO(BaseEntity):
+    # Changes whenever what a route returns may have changed; hashed into the route's ETag.
+    version: str
+    lastModified: Optional[datetime]
+
+    @classmethod
+    def forEntity(cls, id: UUID, updatedDate: Optional[datetime]) -> "EntityVersionDTO":
+        # The cache and the database must give the same version for the same write.
+        updatedDate = toMongoPrecision(updatedDate)
+        return cls(f"{id}:{updatedDate.isoformat() if updatedDate else ''}", updatedDate)
+
+    @classmethod
+    def forCollection(cls, count: int, updatedDate: Optional[datetime]) -> "EntityVersionDTO":
+        updatedDate = toMongoPrecision(updatedDate)
+        return cls(f"{count}:{updatedDate.isoformat() if updatedDate else ''}", updatedDate)
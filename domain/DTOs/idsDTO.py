@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from typing import Generic, Optional, TypeVar
+from uuid import UUID
+
+from domain.abstractEntity.baseEntity import BaseEntity
+
+T = TypeVar("T")
+
+
+@dataclass
+class IdsDTO(BaseEntity):
+    ids: list[UUID]
+
+
+@dataclass
+class ByIdsResultDTO(BaseEntity, Generic[T]):
+    # items lines up with the requested ids, with None where nothing was found.
+    items: list[Optional[T]]
+    missingIds: list[UUID]
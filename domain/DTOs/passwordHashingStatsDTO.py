@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+from domain.abstractEntity.baseEntity import BaseEntity
+
+
+@dataclass
+class PasswordHashingStatsDTO(BaseEntity):
+    workers: int
+    rounds: int
+    queued: int
+    maxQueued: int
+    maxQueuedSeen: int
+    active: int
+    completed: int
+    rejected: int
+    averageWaitMs: float
+    maxWaitMs: float
+    averageHashMs: float
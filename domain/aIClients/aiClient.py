@@ -3,11 +3,14 @@ import asyncio
 from enum import Enum
 import os
 import time
-from typing import Literal, Optional, Type, TypeVar, Union
+from typing import TYPE_CHECKING, AsyncGenerator, Literal, Optional, Type, TypeVar, Union
 
-from openai import AsyncOpenAI
 import httpx
-from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    # Imported when first used, openai and pydantic are slow to import.
+    from openai import AsyncOpenAI
+    from pydantic import BaseModel
 
 from domain.aIClients.aiMessage import AIMessage
 from domain.aws.s3client import S3Client
@@ -16,7 +19,7 @@ from domain.logging.logger import Logger
 from domain.option.option import Option
 from domain.utility.errorHandling import serviceErrorHandling
 
-OT = TypeVar("OT", bound=Union[str, BaseModel])
+OT = TypeVar("OT", bound="Union[str, BaseModel]")
 
 
 class TextGenerationModel(str, Enum):
@@ -59,6 +62,21 @@ IMAGE_COST = {
     ImageGenerationModel.FluxUltra: 0.06,
 }
 
+# Starting guesses, each is then kept as a moving average of how long that model actually takes.
+TYPICAL_GENERATION_SECONDS = {
+    ImageGenerationModel.FluxDev: 6.0,
+    ImageGenerationModel.FluxPro: 8.0,
+    ImageGenerationModel.FluxUltra: 12.0,
+}
+FAILED_GENERATION_STATUSES = frozenset({"Error", "Request Moderated", "Content Moderated"})
+MIN_POLL_SECONDS = 0.25
+MAX_POLL_SECONDS = 2.0
+MAX_GENERATION_SECONDS = 40.0
+
+
+def _recordGenerationTime(model: ImageGenerationModel, seconds: float):
+    TYPICAL_GENERATION_SECONDS[model] = TYPICAL_GENERATION_SECONDS[model] * 0.8 + seconds * 0.2
+
 
 class AIClient:
     _instance: AIClient = None  # type: ignore
@@ -66,7 +84,7 @@ class AIClient:
     httpClient: httpx.AsyncClient
 
     openaiKey: str
-    openaiClient: AsyncOpenAI
+    _openaiClient: Optional[AsyncOpenAI] = None
 
     bflKey: str
 
@@ -80,20 +98,33 @@ class AIClient:
             self.httpClient = httpx.AsyncClient()
 
             self.openaiKey = os.environ.get("OPEN_AI_KEY", "")
-            self.openaiClient = AsyncOpenAI(api_key=self.openaiKey)
 
             self.bflKey = os.environ.get("BFL_KEY", "")
 
             self.initialized = True
 
+    @property
+    def openaiClient(self) -> AsyncOpenAI:
+        if self._openaiClient is None:
+            from openai import AsyncOpenAI
+
+            self._openaiClient = AsyncOpenAI(api_key=self.openaiKey)
+        return self._openaiClient
+
     @serviceErrorHandling
-    async def generateImages(
+    async def streamImages(
         self,
         prompt: str,
         ratio: str,
         n=1,
         model: Union[str, ImageGenerationModel] = ImageGenerationModel.FluxDev,
-    ) -> Option[list[str]]:
+    ) -> Option[AsyncGenerator[str, None]]:
+        """
+        Submits n generations and yields each one's reuploaded S3 url as soon as it is ready, in
+        the order they finish. Every generation is polled and reuploaded on its own, so the first
+        image doesn't wait for the slowest. Generations that fail or time out are logged and left
+        out. Closing the generator early cancels whatever is still running.
+        """
         if isinstance(model, str):
             model = ImageGenerationModel(model)
 
@@ -126,63 +157,98 @@ class AIClient:
         completedRequests = await asyncio.gather(*startTasks)
         requestIds = [request.json()["id"] for request in completedRequests]
 
-        # Maximum 80 attempts, i.e. 40 seconds
-        ogImageUrls = []
-        for _ in range(80):
-            await asyncio.sleep(0.5)
-            getTasks = [
-                self.httpClient.get(
-                    "https://api.bfl.ml/v1/get_result",
-                    headers={
-                        "accept": "application/json",
-                        "x-key": self.bflKey,
-                    },
-                    params={
-                        "id": rid,
-                    },
-                )
+        async def generator() -> AsyncGenerator[str, None]:
+            tasks = [
+                asyncio.create_task(self._generateAndReupload(rid, model, time.time()))
                 for rid in requestIds
             ]
-            results = await asyncio.gather(*getTasks)
-
-            ridsToRemove = []
-            for result, rid in zip(results, requestIds):
-                resultData = result.json()
-                if resultData["status"] == "Ready":
-                    output = resultData["result"]["sample"]
-
-                    if isinstance(output, list):
-                        ogImageUrls.append(output[0])
-                    else:
-                        ogImageUrls.append(output)
-
-                    ridsToRemove.append(rid)
+            imageUrls: list[str] = []
+            try:
+                for task in asyncio.as_completed(tasks):
+                    imageUrlOption = await task
+                    if imageUrlOption.value is None:
+                        Logger.error(imageUrlOption.error)
+                        continue
+                    imageUrls.append(imageUrlOption.value)
+                    yield imageUrlOption.value
+            finally:
+                for task in tasks:
+                    task.cancel()
+                # Wait for the cancellations to land, so no upload is left running unowned.
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+            totalTime = time.time() - startTime
+            cost = IMAGE_COST[model] * len(imageUrls)
+            Logger.info(
+                f"Generated and reuploaded {len(imageUrls)} images using {model.name} in {round(totalTime, 3)} seconds, costing ${cost}",
+                {"time": totalTime, "cost": cost},
+            )
 
-            requestIds = [rid for rid in requestIds if rid not in ridsToRemove]
-            if not requestIds:
-                break
+        return Option(generator())
 
-        totalTime = time.time() - startTime
-        cost = IMAGE_COST[model] * len(ogImageUrls)
-        Logger.info(
-            f"Generated {len(ogImageUrls)} images using {model.name} in {round(totalTime, 3)} seconds, costing ${cost}",
-            {"time": totalTime, "cost": cost},
-        )
+    @serviceErrorHandling
+    async def _generateAndReupload(
+        self, requestId: str, model: ImageGenerationModel, submitTime: float
+    ) -> Option[str]:
+        imageUrl = (await self._pollImage(requestId, model, submitTime)).valueOrThrow()
 
         reuploadStartTime = time.time()
-        s3client = S3Client()
-        reuploadTasks = [s3client.reuploadImage(im) for im in ogImageUrls]
-        imageUrlOptionals = await asyncio.gather(*reuploadTasks)
-        imageUrls: list[str] = [
-            x.value for x in imageUrlOptionals if x.value is not None
-        ]
+        result = await S3Client().reuploadImage(imageUrl)
         totalReuploadTime = time.time() - reuploadStartTime
         Logger.info(
-            f"Reuploaded {len(ogImageUrls)} images in {round(totalReuploadTime, 3)} seconds.",
+            f"Reuploaded image {requestId} in {round(totalReuploadTime, 3)} seconds.",
             {"time": totalReuploadTime},
         )
+        return result
+
+    @serviceErrorHandling
+    async def _pollImage(
+        self, requestId: str, model: ImageGenerationModel, submitTime: float
+    ) -> Option[str]:
+        # The first poll waits for half of this model's typical generation time, after that the
+        # wait shrinks as the expected finish gets closer and grows again once it's overdue.
+        typicalSeconds = TYPICAL_GENERATION_SECONDS[model]
+        delay = max(MIN_POLL_SECONDS, typicalSeconds * 0.5)
+        while True:
+            remainingBudget = MAX_GENERATION_SECONDS - (time.time() - submitTime)
+            if remainingBudget <= 0:
+                return Option.Error(
+                    DomainError(
+                        "AIClient-GenerateImages-E02",
+                        f"Image {requestId} wasn't ready after {MAX_GENERATION_SECONDS} seconds.",
+                    )
+                )
+            # The last poll lands on the deadline instead of giving up before it.
+            await asyncio.sleep(min(delay, remainingBudget))
+
+            result = await self.httpClient.get(
+                "https://api.bfl.ml/v1/get_result",
+                headers={
+                    "accept": "application/json",
+                    "x-key": self.bflKey,
+                },
+                params={
+                    "id": requestId,
+                },
+            )
+            resultData = result.json()
+            status = resultData["status"]
+            if status == "Ready":
+                _recordGenerationTime(model, time.time() - submitTime)
+                output = resultData["result"]["sample"]
+                return Option(output[0] if isinstance(output, list) else output)
+            if status in FAILED_GENERATION_STATUSES:
+                return Option.Error(
+                    DomainError(
+                        "AIClient-GenerateImages-E03", f"Image {requestId} failed: {status}."
+                    )
+                )
 
-        return Option(imageUrls)
+            remaining = typicalSeconds - (time.time() - submitTime)
+            if remaining > 0:
+                delay = max(MIN_POLL_SECONDS, remaining / 2)
+            else:
+                delay = min(MAX_POLL_SECONDS, max(delay, MIN_POLL_SECONDS) * 1.5)
 
     @serviceErrorHandling
     async def isSafe(self, inputText: str) -> bool:
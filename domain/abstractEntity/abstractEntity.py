@@ -1,8 +1,10 @@
 from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Optional
+from typing import Any, Iterable, Optional
 from uuid import UUID, uuid4
 from domain.abstractEntity.baseEntity import BaseEntity
+from domain.abstractEntity.entityIndex import EntityIndex, QueryShape
+from domain.utility.dateExtension import toMongoPrecision
 from domain.utility.stringExtension import camelToKebab, lowerFirstLetter, plural
 from domain.utility.userProvider import UserProvider
 
@@ -25,9 +27,99 @@ class AbstractEntity(BaseEntity):
         collection_name = "/" + camelToKebab(plural(cls.__name__))
         return collection_name
 
-    def fillInfo(self):
+    @classmethod
+    def fromDocument(cls, document: dict[str, Any], fields: Optional[Iterable[str]] = None):
+        # Hydrates an entity read from the database, remembering the document for change tracking.
+        entity = cls.fromDict(document, fields)
+        entity.markPersisted(document)
+        return entity
+
+    def markPersisted(self, document: dict[str, Any]):
+        self._persistedState = document
+
+    def isPersisted(self) -> bool:
+        return getattr(self, "_persistedState", None) is not None
+
+    def getChanges(self) -> dict[str, dict[str, Any]]:
+        """
+        Builds a minimal Mongo update document from the fields that changed since the entity was
+        loaded or last saved. Lists that only grew at the end become a $push, cleared fields an $unset.
+        """
+        persisted: dict[str, Any] = getattr(self, "_persistedState", None) or {}
+        setFields: dict[str, Any] = {}
+        unsetFields: dict[str, Any] = {}
+        pushFields: dict[str, Any] = {}
+
+        for name, value in self.toDict().items():
+            previous = persisted.get(name)
+            if previous == value and (name in persisted or value is None):
+                continue
+            if value is None:
+                unsetFields[name] = ""
+            elif (
+                isinstance(previous, list)
+                and isinstance(value, list)
+                and len(value) > len(previous)
+                and value[: len(previous)] == previous
+            ):
+                pushFields[name] = {"$each": value[len(previous) :]}
+            else:
+                setFields[name] = value
+
+        update: dict[str, dict[str, Any]] = {}
+        if setFields:
+            update["$set"] = setFields
+        if unsetFields:
+            update["$unset"] = unsetFields
+        if pushFields:
+            update["$push"] = pushFields
+        return update
+
+    @classmethod
+    def getProjectionProfiles(cls) -> dict[str, list[str]]:
+        # Named field sets clients can ask for with ?fields=<profile>.
+        return {}
+
+    @classmethod
+    def getIndexes(cls) -> list[EntityIndex]:
+        # Serves keyset pagination and createdDate range queries on every collection, and the
+        # index-only version lookups behind conditional GETs.
+        indexes = [
+            EntityIndex([("createdDate", -1), ("_id", -1)]),
+            EntityIndex([("updatedDate", -1)]),
+            EntityIndex([("_id", 1), ("updatedDate", -1)]),
+        ]
+        if "userId" in {f.name for f in fields(cls)}:
+            indexes.append(EntityIndex([("userId", 1), ("createdDate", -1)]))
+        return indexes
+
+    @classmethod
+    def getQueryShapes(cls) -> list[QueryShape]:
         now = datetime.utcnow()
-        userId = UserProvider.userId()
+        shapes = [
+            QueryShape(
+                {"createdDate": {"$gt": now, "$lte": now}}, [("createdDate", -1)]
+            ),
+            QueryShape({}, [("createdDate", -1), ("_id", -1)]),
+            QueryShape({}, [("updatedDate", -1)]),
+        ]
+        if "userId" in {f.name for f in fields(cls)}:
+            shapes.append(
+                QueryShape({"userId": {"$in": [UUID(int=0)]}}, [("createdDate", -1)])
+            )
+        return shapes
+
+    def fillInfo(self, userId: Optional[UUID] = None, now: Optional[datetime] = None):
+        # Nested entities are handed the same user and timestamp instead of looking them up again.
+        # Stamped at the precision Mongo stores, so cached copies match what's read back.
+        now = toMongoPrecision(now or datetime.utcnow())
+        userId = userId or UserProvider.userId()
+        if self.isPartial():
+            # Only the update is stamped, the rest of the document isn't loaded.
+            self.updatedDate = now
+            self.updatedBy = userId
+            self._projectedFields = self._projectedFields | {"updatedDate", "updatedBy"}
+            return
         if self.id is None or self.id == UUID(int=0):
             self.id = uuid4()
         self.createdDate = self.createdDate or now
@@ -38,11 +130,11 @@ class AbstractEntity(BaseEntity):
             for field in fields(self):
                 fieldValue = getattr(self, field.name)
                 if isinstance(fieldValue, AbstractEntity):
-                    fieldValue.fillInfo()
+                    fieldValue.fillInfo(userId, now)
                 elif isinstance(fieldValue, list) and all(
                     (isinstance(item, AbstractEntity) for item in fieldValue)
                 ):
                     for item in fieldValue:
-                        item.fillInfo()
+                        item.fillInfo(userId, now)
         except:
             pass
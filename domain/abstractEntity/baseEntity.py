@@ -1,9 +1,10 @@
 from dataclasses import asdict, dataclass, field, fields, is_dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Union, get_args, get_origin
+from typing import Iterable, Optional, Union, get_args, get_origin
 from uuid import UUID
 
+from domain.abstractEntity.entityCodec import codecFor, encodeValue
 from domain.utility.stringExtension import isUUID
 
 
@@ -11,47 +12,10 @@ from domain.utility.stringExtension import isUUID
 class BaseEntity:
 
     def handleValue(self, fieldValue, safedate: bool):
-        fieldValue = self.handleEnum(fieldValue)
-        if isinstance(
-            fieldValue, type
-        ):  # Check if the field value is a type, which should specifically be skipped
-            return str(fieldValue)
-        elif is_dataclass(fieldValue):
-            return fieldValue.toDict(safedate)
-        elif isinstance(fieldValue, datetime):
-            return fieldValue.isoformat() if safedate else fieldValue
-        elif isinstance(fieldValue, list):
-            return [
-                item.toDict(safedate) if is_dataclass(item) else item
-                for item in fieldValue
-            ]
-        else:
-            return fieldValue
+        return encodeValue(fieldValue, safedate)
 
     def toDict(self, safedate = False):
-        result = {}
-        excludedFields = []
-        for field in fields(self):
-            if not hasattr(self, field.name):
-                continue
-            fieldValue = getattr(self, field.name)
-            result[field.name] = self.handleValue(fieldValue, safedate)
-        for attrName in dir(self):
-            if attrName.startswith("_"):
-                continue
-            if attrName in excludedFields:
-                continue
-            if attrName in result:
-                continue
-            attrValue = getattr(self, attrName)
-            if callable(attrValue):
-                continue
-            if attrName not in result:
-                try:
-                    result[attrName] = self.handleValue(attrValue, safedate)
-                except Exception as e:
-                    print(e)
-        return result
+        return codecFor(type(self)).encode(self, safedate)
 
     @staticmethod
     def handleEnum(value):
@@ -60,43 +24,27 @@ class BaseEntity:
         return value
 
     @classmethod
-    def fromDict(cls, d: dict):
-        fieldTypes = {f.name: f.type for f in fields(cls)}
-        kwargs = {}
-        for f, expectedType in fieldTypes.items():
-            if f in d and d[f] is not None:
-                originType = get_origin(expectedType)
-                argTypes = get_args(expectedType)
+    def fromDict(cls, d: dict, fields: Optional[Iterable[str]] = None):
+        # With fields, only those are hydrated and the entity is partial.
+        return codecFor(cls).decode(d, frozenset(fields) if fields is not None else None)
 
-                if originType == Union and type(None) in argTypes:
-                    expectedType = next(t for t in argTypes if t is not type(None))
+    def isPartial(self) -> bool:
+        return "_projectedFields" in self.__dict__
 
-                if expectedType == UUID:
-                    try:
-                        kwargs[f] = UUID(str(d[f]))
-                    except:
-                        kwargs[f] = d[f]
-                elif expectedType == datetime and isinstance(d[f], str):
-                    kwargs[f] = datetime.fromisoformat(d[f])
-                elif get_origin(expectedType) == list:
-                    elemType = get_args(expectedType)[0]
-                    if elemType == UUID:
-                        kwargs[f] = [UUID(str(x)) for x in d[f]]
-                    elif is_dataclass(elemType):
-                        kwargs[f] = [elemType.fromDict(x) for x in d[f]]
-                    else:
-                        kwargs[f] = d[f]
-                elif is_dataclass(expectedType):
-                    kwargs[f] = expectedType.fromDict(d[f])
-                elif isinstance(expectedType, type) and issubclass(expectedType, Enum):
-                    kwargs[f] = expectedType(d[f])
-                else:
-                    kwargs[f] = d[f]
-            else:
-                kwargs[f] = None
-        instance = cls.__new__(cls)  # Create instance without calling __init__
-        for key, value in kwargs.items():
-            setattr(instance, key, value)
+    def projectedFields(self) -> Optional[frozenset[str]]:
+        return self.__dict__.get("_projectedFields")
+
+    def project(self, fields: Iterable[str]):
+        # A partial copy holding only the given fields that this entity has loaded.
+        fields = frozenset(fields)
+        currentFields = self.projectedFields()
+        if currentFields is not None:
+            fields = fields & currentFields
+        instance = type(self).__new__(type(self))
+        instance.__dict__.update(
+            {name: value for name, value in self.__dict__.items() if name in fields}
+        )
+        instance._projectedFields = fields
         return instance
 
     @classmethod
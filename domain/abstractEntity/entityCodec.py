@@ -0,0 +1,211 @@
+from dataclasses import fields, is_dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Optional, Union, get_args, get_origin, get_type_hints
+from uuid import UUID
+
+# Compiled per-class encoders and decoders for BaseEntity.
+# Each entity class gets one EntityCodec, built lazily on first use from its resolved type hints.
+# fromDict/toDict then just walk a precomputed list of (fieldName, converter) pairs instead of
+# re-inspecting fields, origins and dir() for every row.
+
+Decoder = Optional[Callable[[Any], Any]]
+Encoder = Callable[[Any, bool], Any]
+
+_MISSING = object()
+_SCALAR_TYPES = (str, int, float, bool, UUID)
+
+
+def encodeValue(value: Any, safedate: bool) -> Any:
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, type):  # Types should specifically be skipped
+        return str(value)
+    elif is_dataclass(value):
+        return value.toDict(safedate)  # type: ignore
+    elif isinstance(value, datetime):
+        return value.isoformat() if safedate else value
+    elif isinstance(value, list):
+        return [
+            item.toDict(safedate) if is_dataclass(item) else item  # type: ignore
+            for item in value
+        ]
+    else:
+        return value
+
+
+def _unwrapOptional(expectedType: Any) -> Any:
+    if get_origin(expectedType) == Union:
+        argTypes = get_args(expectedType)
+        if type(None) in argTypes:
+            return next(t for t in argTypes if t is not type(None))
+    return expectedType
+
+
+def _decodeUUID(value: Any) -> Any:
+    if type(value) is UUID:
+        return value
+    try:
+        return UUID(str(value))
+    except:
+        return value
+
+
+def _decodeDatetime(value: Any) -> Any:
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
+
+
+def _copyList(value: Any) -> Any:
+    return list(value) if isinstance(value, list) else value
+
+
+def _copyDict(value: Any) -> Any:
+    return dict(value) if isinstance(value, dict) else value
+
+
+def _decodeUUIDList(value: Any) -> Any:
+    return [x if type(x) is UUID else UUID(str(x)) for x in value]
+
+
+def _makeDecoder(expectedType: Any) -> Decoder:
+    expectedType = _unwrapOptional(expectedType)
+    if expectedType == UUID:
+        return _decodeUUID
+    if expectedType == datetime:
+        return _decodeDatetime
+    if get_origin(expectedType) == list:
+        argTypes = get_args(expectedType)
+        elemType = argTypes[0] if argTypes else Any
+        if elemType == UUID:
+            return _decodeUUIDList
+        if is_dataclass(elemType):
+            elemFromDict = elemType.fromDict  # type: ignore
+            return lambda value: [elemFromDict(x) for x in value]
+        # Copied so entities never share a mutable list with their source document.
+        return _copyList
+    if get_origin(expectedType) == dict:
+        return _copyDict
+    if is_dataclass(expectedType):
+        return expectedType.fromDict  # type: ignore
+    if isinstance(expectedType, type) and issubclass(expectedType, Enum):
+        return expectedType
+    return None
+
+
+def _makeEncoder(expectedType: Any) -> Encoder:
+    expectedType = _unwrapOptional(expectedType)
+    if expectedType in _SCALAR_TYPES:
+        return lambda value, safedate: (
+            value if type(value) is expectedType else encodeValue(value, safedate)
+        )
+    if expectedType == datetime:
+        return lambda value, safedate: (
+            (value.isoformat() if safedate else value)
+            if type(value) is datetime
+            else encodeValue(value, safedate)
+        )
+    if get_origin(expectedType) == list:
+        argTypes = get_args(expectedType)
+        if argTypes and argTypes[0] in _SCALAR_TYPES:
+            return lambda value, safedate: (
+                list(value) if type(value) is list else encodeValue(value, safedate)
+            )
+    if isinstance(expectedType, type) and issubclass(expectedType, Enum):
+        return lambda value, safedate: (
+            value.value if isinstance(value, Enum) else encodeValue(value, safedate)
+        )
+    return encodeValue
+
+
+class EntityCodec:
+    entityType: type
+    fieldNames: frozenset[str]
+    decoders: list[tuple[str, Decoder]]
+    encoders: list[tuple[str, Encoder]]
+    classExtras: list[str]
+
+    def __init__(self, entityType: type):
+        self.entityType = entityType
+        entityFields = fields(entityType)
+        try:
+            typeHints = get_type_hints(entityType)
+        except Exception:
+            typeHints = {}
+        fieldTypes = {f.name: typeHints.get(f.name, f.type) for f in entityFields}
+
+        self.fieldNames = frozenset(fieldTypes)
+        self.decoders = [(name, _makeDecoder(t)) for name, t in fieldTypes.items()]
+        self.encoders = [(name, _makeEncoder(t)) for name, t in fieldTypes.items()]
+
+        # Public, non-callable class attributes (e.g. properties) are serialized alongside fields.
+        self.classExtras = [
+            name
+            for name in dir(entityType)
+            if not name.startswith("_")
+            and name not in self.fieldNames
+            and not callable(getattr(entityType, name, None))
+        ]
+
+    def decode(self, d: Any, projectedFields: Optional[frozenset[str]] = None) -> Any:
+        values = {}
+        for name, decoder in self.decoders:
+            if projectedFields is not None and name not in projectedFields:
+                continue
+            value = d.get(name)
+            if value is not None and decoder is not None:
+                value = decoder(value)
+            values[name] = value
+        instance = self.entityType.__new__(self.entityType)  # Create instance without calling __init__
+        instance.__dict__.update(values)
+        if projectedFields is not None:
+            # Partial entity: only these fields were loaded, and only these are serialized.
+            instance._projectedFields = projectedFields
+        return instance
+
+    def encode(self, entity: Any, safedate: bool) -> dict[str, Any]:
+        result = {}
+        instanceValues = entity.__dict__
+        projectedFields = instanceValues.get("_projectedFields")
+        for name, encoder in self.encoders:
+            if projectedFields is not None and name not in projectedFields:
+                continue
+            value = instanceValues.get(name, _MISSING)
+            if value is _MISSING:
+                value = getattr(entity, name, _MISSING)
+                if value is _MISSING:
+                    continue
+            result[name] = encoder(value, safedate)
+
+        extras = [
+            name for name in instanceValues.keys() - self.fieldNames if name[0] != "_"
+        ]
+        if projectedFields is not None:
+            return result
+        if extras or self.classExtras:
+            for name in sorted(set(extras).union(self.classExtras)):
+                value = getattr(entity, name)
+                if callable(value):
+                    continue
+                try:
+                    result[name] = encodeValue(value, safedate)
+                except Exception as e:
+                    # Imported here, the logger depends on entities through UserProvider.
+                    from domain.logging.logger import Logger
+
+                    Logger.warning(
+                        "EntityCodec-Encode-W01",
+                        f"Couldn't encode {self.entityType.__name__}.{name}, left it out: {e}",
+                        {"attribute": name},
+                    )
+        return result
+
+
+def codecFor(entityType: type) -> EntityCodec:
+    # Stored on the class itself so subclasses never reuse a parent's codec.
+    codec = entityType.__dict__.get("_entityCodec")
+    if codec is None:
+        codec = EntityCodec(entityType)
+        setattr(entityType, "_entityCodec", codec)
+    return codec
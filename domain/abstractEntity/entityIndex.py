@@ -0,0 +1,80 @@
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from domain.abstractEntity.baseEntity import BaseEntity
+
+
+@dataclass
+class EntityIndex(BaseEntity):
+    keys: list[tuple[str, int]]
+    unique: bool
+    expireAfterSeconds: Optional[int]
+    partialFilterExpression: Optional[dict[str, Any]]
+    name: Optional[str]
+
+    def __init__(
+        self,
+        keys: list[tuple[str, int]],
+        unique: bool = False,
+        expireAfterSeconds: Optional[int] = None,
+        partialFilterExpression: Optional[dict[str, Any]] = None,
+        name: Optional[str] = None,
+    ):
+        self.keys = keys
+        self.unique = unique
+        self.expireAfterSeconds = expireAfterSeconds
+        self.partialFilterExpression = partialFilterExpression
+        self.name = name
+
+    def indexName(self) -> str:
+        # Same naming scheme Mongo uses by default, so existing indexes line up.
+        return self.name or "_".join(f"{field}_{direction}" for field, direction in self.keys)
+
+    def indexOptions(self) -> dict[str, Any]:
+        options: dict[str, Any] = {"name": self.indexName()}
+        if self.unique:
+            options["unique"] = True
+        if self.expireAfterSeconds is not None:
+            options["expireAfterSeconds"] = self.expireAfterSeconds
+        if self.partialFilterExpression is not None:
+            options["partialFilterExpression"] = self.partialFilterExpression
+        return options
+
+    def matches(self, existing: dict[str, Any]) -> bool:
+        existingKeys = [(field, int(direction)) for field, direction in existing["key"].items()]
+        return (
+            existingKeys == list(self.keys)
+            and bool(existing.get("unique", False)) == self.unique
+            and existing.get("expireAfterSeconds") == self.expireAfterSeconds
+            and existing.get("partialFilterExpression") == self.partialFilterExpression
+        )
+
+
+@dataclass
+class QueryShape(BaseEntity):
+    # A query the application is known to run, with representative values, used for explain checks.
+    filter: dict[str, Any]
+    sort: Optional[list[tuple[str, int]]]
+
+    def __init__(
+        self, filter: dict[str, Any], sort: Optional[list[tuple[str, int]]] = None
+    ):
+        self.filter = filter
+        self.sort = sort
+
+
+@dataclass
+class IndexReconciliation(BaseEntity):
+    collectionName: str
+    created: list[str]
+    dropped: list[str]
+    # Declared with different options than the existing index, left for tools/reconcileIndexes.py.
+    outdated: list[str] = field(default_factory=list)
+
+
+@dataclass
+class QueryShapeExplanation(BaseEntity):
+    collectionName: str
+    queryShape: QueryShape
+    stages: list[str]
+    usesCollectionScan: bool
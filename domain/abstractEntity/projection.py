@@ -0,0 +1,71 @@
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping, Optional, Type
+
+from domain.abstractEntity.abstractEntity import AbstractEntity
+from domain.abstractEntity.baseEntity import BaseEntity
+from domain.abstractEntity.entityCodec import codecFor
+from domain.domainError.domainErrorException import DomainErrorException
+from domain.pagination.page import Page
+
+PROJECTION_PARAMETER = "fields"
+
+
+@dataclass
+class Projection(BaseEntity):
+    fields: frozenset[str]
+
+    def __init__(self, fields: Iterable[str]):
+        # id is always loaded, entities are addressed by it.
+        self.fields = frozenset(fields) | {"id"}
+
+    @classmethod
+    def fromArgs(
+        cls, entityType: Type[AbstractEntity], args: Mapping[str, Any]
+    ) -> Optional["Projection"]:
+        # ?fields=id,imageUrl or ?fields=<profile>; None when the request didn't ask for one.
+        value = args.get(PROJECTION_PARAMETER)
+        if value is None:
+            return None
+        profiles = entityType.getProjectionProfiles()
+        if value in profiles:
+            return cls(profiles[value])
+
+        names = [name.strip() for name in value.split(",") if name.strip()]
+        if not names:
+            raise DomainErrorException.new(
+                "Projection-E01", f"{PROJECTION_PARAMETER} must name at least one field."
+            )
+        unknown = [name for name in names if name not in codecFor(entityType).fieldNames]
+        if unknown:
+            raise DomainErrorException.new(
+                "Projection-E02",
+                f"Unknown {entityType.__name__} fields: {', '.join(unknown)}.",
+            )
+        return cls(names)
+
+    def including(self, *names: str) -> "Projection":
+        return Projection(self.fields | set(names))
+
+    def mongoProjection(self) -> dict[str, int]:
+        return {name: 1 for name in self.fields}
+
+    def apply(self, value: Any, entityType: Type[AbstractEntity]) -> Any:
+        # Trims route results that weren't already projected by the query.
+        if isinstance(value, entityType):
+            return value.project(self.fields)
+        if isinstance(value, list):
+            return [self.apply(item, entityType) for item in value]
+        if isinstance(value, Page):
+            return Page(
+                [self.apply(item, entityType) for item in value.items],
+                value.nextCursor,
+                value.prevCursor,
+            )
+        if isinstance(value, AsyncIterator):
+            return self._applyToStream(value, entityType)
+        return value
+
+    async def _applyToStream(self, items: AsyncIterator[Any], entityType: Type[AbstractEntity]):
+        async for item in items:
+            yield self.apply(item, entityType)
@@ -1,12 +1,15 @@
+import asyncio
 from datetime import datetime
 from io import BytesIO
 import os
 import random
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import httpx
-import aioboto3
-from PIL import Image
+
+if TYPE_CHECKING:
+    # aioboto3 and Pillow are imported when first used, both are slow to import.
+    from PIL import Image
 
 from domain.domainError.domainError import DomainError
 from domain.option.option import Option
@@ -20,7 +23,6 @@ class S3Client:
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._session = aioboto3.Session()
         return cls._instance
 
     def __init__(self):
@@ -32,8 +34,10 @@ class S3Client:
             self.serveRegion = os.getenv("S3_SERVE_REGION", "us-east-2")
 
     async def _get_client(self):
-        if self._session is None:
-            raise Exception("Session not initialized")
+        if S3Client._session is None:
+            import aioboto3
+
+            S3Client._session = aioboto3.Session()
         client = await self._session.client(
             "s3",
             aws_access_key_id=self.aws_access_key_id,
@@ -54,6 +58,8 @@ class S3Client:
         if s3ImageKey is None:
             s3ImageKey = f"image-pool/{obfuscatedDate}/{random.randint(100000000, 999999999)}-{random.randint(100000000, 999999999)}.webp"
 
+        from PIL import Image
+
         client = await self._get_client()
         try:
             with Image.open(bytes) as image:
@@ -106,6 +112,16 @@ class S3Client:
             f"https://{self.bucket}.s3.{self.serveRegion}.amazonaws.com/{s3ImageKey}"
         )
 
+    @staticmethod
+    def _toWebp(content: bytes) -> bytes:
+        from PIL import Image
+
+        with Image.open(BytesIO(content)) as image:
+            image = image.convert("RGBA")
+            with BytesIO() as webp_image_io:
+                image.save(webp_image_io, format="WEBP", quality=80)
+                return webp_image_io.getvalue()
+
     @serviceErrorHandling
     async def reuploadImage(self, imageUrl, s3ImageKey: Optional[str] = None):
         async with httpx.AsyncClient() as httpClient:
@@ -120,33 +136,29 @@ class S3Client:
         if s3ImageKey is None:
             s3ImageKey = f"image-pool/{obfuscatedDate}/{random.randint(100000000, 999999999)}-{random.randint(100000000, 999999999)}.webp"
 
-        with Image.open(BytesIO(response.content)) as image:
-            image = image.convert("RGBA")
+        # Transcoding is CPU bound, on a thread it doesn't hold up other requests or uploads.
+        webpBytes = await asyncio.to_thread(self._toWebp, response.content)
 
-            # Convert the image to WebP
-            with BytesIO() as webp_image_io:
-                image.save(webp_image_io, format="WEBP", quality=80)
-                webp_image_io.seek(0)
+        with BytesIO(webpBytes) as webp_image_io:
+            contentType = "image/webp"
 
-                contentType = "image/webp"
-
-                client = await self._get_client()
-                try:
-                    await client.upload_fileobj(
-                        webp_image_io,
-                        self.bucket,
-                        s3ImageKey,
-                        ExtraArgs={"ContentType": contentType},
-                    )
-                finally:
-                    await client.__aexit__(None, None, None)
+            client = await self._get_client()
+            try:
+                await client.upload_fileobj(
+                    webp_image_io,
+                    self.bucket,
+                    s3ImageKey,
+                    ExtraArgs={"ContentType": contentType},
+                )
+            finally:
+                await client.__aexit__(None, None, None)
 
         return Option(
             f"https://{self.bucket}.s3.{self.serveRegion}.amazonaws.com/{s3ImageKey}"
         )
 
     @serviceErrorHandling
-    async def uploadImage(self, image: Image.Image, s3ImageKey: Optional[str] = None):
+    async def uploadImage(self, image: "Image.Image", s3ImageKey: Optional[str] = None):
         # The folder should be a date, and remain in chronological order, but still look obfuscated to the naked eye.
         now = datetime.utcnow()
         dateInt = int(now.isoformat()[:10].replace("-", ""))
@@ -194,6 +206,8 @@ class S3Client:
 
         s3ImageKey = f"image-pool/{obfuscatedDate}/{random.randint(100000000, 999999999)}-{random.randint(100000000, 999999999)}.png"
 
+        from PIL import Image
+
         with BytesIO(response.content) as content_io:
             with Image.open(content_io) as image:
                 with BytesIO() as png_image_io:
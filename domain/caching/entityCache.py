@@ -0,0 +1,107 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+from uuid import UUID
+
+from domain.abstractEntity.baseEntity import BaseEntity
+
+
+@dataclass
+class CacheStats(BaseEntity):
+    size: int
+    maxSize: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+
+class EntityCache(ABC):
+    """
+    Backend for AbstractService's read-through cache. Entries are entity documents (toDict output)
+    rather than entity instances, so callers never share mutable objects and a shared cache can
+    store them as-is.
+    """
+
+    @abstractmethod
+    async def getMany(self, ids: list[UUID]) -> dict[UUID, dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    async def setMany(self, documents: dict[UUID, dict[str, Any]]):
+        ...
+
+    @abstractmethod
+    async def delete(self, id: UUID):
+        ...
+
+    @abstractmethod
+    async def clear(self):
+        ...
+
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        ...
+
+
+class InMemoryEntityCache(EntityCache):
+    # Per-process LRU with a fixed time to live per entry.
+
+    maxSize: int
+    ttlSeconds: float
+    entries: OrderedDict[UUID, tuple[float, dict[str, Any]]]
+
+    def __init__(self, maxSize: int = 10_000, ttlSeconds: float = 30.0):
+        self.maxSize = maxSize
+        self.ttlSeconds = ttlSeconds
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    async def getMany(self, ids: list[UUID]) -> dict[UUID, dict[str, Any]]:
+        now = time.monotonic()
+        found = {}
+        for id in ids:
+            entry = self.entries.get(id)
+            if entry is None:
+                self.misses += 1
+                continue
+            expiresAt, document = entry
+            if expiresAt <= now:
+                del self.entries[id]
+                self.expirations += 1
+                self.misses += 1
+                continue
+            self.entries.move_to_end(id)
+            self.hits += 1
+            found[id] = document
+        return found
+
+    async def setMany(self, documents: dict[UUID, dict[str, Any]]):
+        expiresAt = time.monotonic() + self.ttlSeconds
+        for id, document in documents.items():
+            self.entries[id] = (expiresAt, document)
+            self.entries.move_to_end(id)
+        while len(self.entries) > self.maxSize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    async def delete(self, id: UUID):
+        self.entries.pop(id, None)
+
+    async def clear(self):
+        self.entries.clear()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            len(self.entries),
+            self.maxSize,
+            self.hits,
+            self.misses,
+            self.evictions,
+            self.expirations,
+        )
@@ -1,6 +1,5 @@
 import os
-import boto3
-from typing import Optional
+from typing import Any, Optional
 
 from domain.option.option import Option
 from domain.utility.errorHandling import serviceErrorHandling
@@ -16,9 +15,18 @@ class EmailClient:
 
     def _initialize(self):
         self.awsRegion = os.environ.get("AWS_REGION", 'us-west-2')
-        self.sesClient = boto3.client('ses', region_name=self.awsRegion)
+        self._sesClient: Any = None
         self.defaultSender = os.environ.get("EMAIL_SENDER", "noreply@generic.com")
 
+    @property
+    def sesClient(self) -> Any:
+        # boto3 is imported and the SES client built on the first email, not at startup.
+        if self._sesClient is None:
+            import boto3
+
+            self._sesClient = boto3.client('ses', region_name=self.awsRegion)
+        return self._sesClient
+
     @serviceErrorHandling
     async def sendEmail(self, subject: str, recipient: str, body: str, isHtml: bool = True) -> Option[bool]:
         body_content = {
@@ -41,5 +49,3 @@ class EmailClient:
         )
         return Option(True)
 
-# Instantiate the singleton EmailClient
-emailClient = EmailClient()
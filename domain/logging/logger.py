@@ -1,10 +1,7 @@
 import logging
 import traceback
-import watchtower
 from datetime import datetime
 from threading import Lock
-import boto3
-from botocore.exceptions import ClientError
 import os
 import json
 from typing import Any, Optional, Union
@@ -47,6 +44,11 @@ class Logger:
 
             # CloudWatch handler (for production)
             if is_production:
+                # Only production ships logs to CloudWatch, so only it pays for importing the SDKs.
+                import boto3
+                import watchtower
+                from botocore.exceptions import ClientError
+
                 try:
                     # Set up AWS session
                     session = boto3.Session(
@@ -81,16 +81,9 @@ class Option(Generic[T]):
             )
 
     def okOrNotFound(self, hide=False, status=404):
+        # Entities are returned as-is, the app's JSON provider serializes them in one pass.
         if self.value is not None:
-            if isinstance(self.value, list):
-                if all(hasattr(item, "toDict") for item in self.value):
-                    return [item.toDict(True) for item in self.value]  # type: ignore
-                else:
-                    return self.value
-            elif hasattr(self.value, "toDict"):
-                return self.value.toDict(True)  # type: ignore
-            else:
-                return self.value
+            return self.value
         raise DomainErrorException(
             self.error or DomainError("Error-E00", "Bad request", None, status)
         )
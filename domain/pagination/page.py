@@ -0,0 +1,76 @@
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Generic, Mapping, Optional, TypeVar
+from uuid import UUID
+
+from domain.abstractEntity.baseEntity import BaseEntity
+from domain.domainError.domainErrorException import DomainErrorException
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 500
+
+PAGE_PARAMETERS = ("limit", "after", "before")
+
+
+def encodeCursor(createdDate: datetime, id: UUID) -> str:
+    rawCursor = json.dumps([createdDate.isoformat(), str(id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(rawCursor.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decodeCursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        createdDate, id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(createdDate), UUID(id)
+    except Exception:
+        raise DomainErrorException.new("PageRequest-E02", "Invalid page cursor.")
+
+
+@dataclass
+class PageRequest(BaseEntity):
+    limit: int
+    after: Optional[str]
+    before: Optional[str]
+
+    def __init__(
+        self,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ):
+        if limit < 1 or limit > MAX_PAGE_LIMIT:
+            raise DomainErrorException.new(
+                "PageRequest-E01", f"limit must be between 1 and {MAX_PAGE_LIMIT}."
+            )
+        if after is not None and before is not None:
+            raise DomainErrorException.new(
+                "PageRequest-E03", "Only one of after and before can be given."
+            )
+        self.limit = limit
+        self.after = after
+        self.before = before
+
+    @classmethod
+    def fromArgs(cls, args: Mapping[str, Any]) -> Optional["PageRequest"]:
+        # Returns None when the request didn't ask for pagination at all.
+        if not any(name in args for name in PAGE_PARAMETERS):
+            return None
+        try:
+            limit = int(args.get("limit", DEFAULT_PAGE_LIMIT))
+        except ValueError:
+            raise DomainErrorException.new("PageRequest-E04", "limit must be an integer.")
+        return cls(limit, args.get("after") or None, args.get("before") or None)
+
+    def isBackward(self) -> bool:
+        return self.before is not None
+
+
+@dataclass
+class Page(BaseEntity, Generic[T]):
+    items: list[T]
+    nextCursor: Optional[str]
+    prevCursor: Optional[str]
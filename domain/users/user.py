@@ -4,8 +4,10 @@ import random
 from typing import Optional
 from uuid import UUID, uuid4
 from domain.abstractEntity.abstractEntity import AbstractEntity
+from domain.abstractEntity.entityIndex import EntityIndex, QueryShape
 from domain.users.userRole import UserRole
-from domain.utility.auth import hashPassword
+from domain.utility.auth import UNUSABLE_PASSWORD
+from domain.utility.dateExtension import toMongoPrecision
 
 
 @dataclass
@@ -16,27 +18,55 @@ class User(AbstractEntity):
     roles: list[str]
     profileImageUrl: Optional[str]
     salt: str
-    verificationHash: str
+    verificationHash: Optional[str]
     verificationSendTime: Optional[datetime]
+    verificationAttempts: int
 
     isGuest: bool
     isVerified: bool
 
-    def __init__(self):
-        now = datetime.utcnow()
-        super().__init__(uuid4(), now, None, now, None)
+    def __init__(self, id: Optional[UUID] = None):
+        now = toMongoPrecision(datetime.utcnow())
+        super().__init__(id or uuid4(), now, None, now, None)
 
         randomNumber = str(random.randint(100_000_000, 999_999_999))
         self.username = f"user_{randomNumber}"
-        self.salt = str(random.randint(100_000_000, 999_999_999))
+        # Set along with the password when the guest signs up.
+        self.salt = ""
 
-        randomNumber2 = str(random.randint(100_000_000, 999_999_999))
-        self.password = hashPassword(str(randomNumber2) + self.salt)
+        # Guests have no password to sign in with until they sign up.
+        self.password = UNUSABLE_PASSWORD
+        self.verificationHash = None
+        self.verificationSendTime = None
+        self.verificationAttempts = 0
         self.isGuest = True
         self.isVerified = False
         self.roles = []
         self.email = ""
         self.profileImageUrl = None
 
-    def changePassword(self, newPassword: str):
-        self.password = hashPassword(newPassword + self.salt)
+    @classmethod
+    def getProjectionProfiles(cls) -> dict[str, list[str]]:
+        return {
+            # What other users may see, no credentials or verification state.
+            "public": ["id", "createdDate", "username", "profileImageUrl", "roles"],
+        }
+
+    @classmethod
+    def getIndexes(cls) -> list[EntityIndex]:
+        return super().getIndexes() + [
+            EntityIndex([("username", 1)], unique=True),
+            # Guests all have an empty email, so only real addresses are unique.
+            EntityIndex(
+                [("email", 1)],
+                unique=True,
+                partialFilterExpression={"email": {"$gt": ""}},
+            ),
+        ]
+
+    @classmethod
+    def getQueryShapes(cls) -> list[QueryShape]:
+        return super().getQueryShapes() + [
+            QueryShape({"username": {"$eq": "explain_user"}}),
+            QueryShape({"email": "explain@generic.com"}),
+        ]
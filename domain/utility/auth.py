@@ -1,11 +1,146 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
 import bcrypt
 
+from domain.DTOs.passwordHashingStatsDTO import PasswordHashingStatsDTO
+from domain.domainError.domainErrorException import DomainErrorException
+
+T = TypeVar("T")
+
+# Stored in place of a hash for accounts that can't sign in with a password; never matches.
+UNUSABLE_PASSWORD = "!"
+
+
+def _intSetting(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    return int(value) if value else default
+
 
-def hashPassword(password: str) -> str:
-    salt = bcrypt.gensalt()
+def hashPassword(password: str, rounds: Optional[int] = None) -> str:
+    salt = bcrypt.gensalt(rounds=rounds or _intSetting("BCRYPT_ROUNDS", 12))
     hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
     return hashed.decode("utf-8")
 
 
 def checkPassword(password: str, hashedPassword: str) -> bool:
-    return bcrypt.checkpw(password.encode("utf-8"), hashedPassword.encode("utf-8"))
+    try:
+        return bcrypt.checkpw(password.encode("utf-8"), hashedPassword.encode("utf-8"))
+    except ValueError:
+        # Not a bcrypt hash, e.g. UNUSABLE_PASSWORD.
+        return False
+
+
+class PasswordHashingPool:
+    """
+    Runs bcrypt on a small dedicated thread pool so a burst of logins doesn't block the event loop.
+    bcrypt releases the GIL while hashing, so the workers run in parallel with the loop and each
+    other. At most `workers` hashes run at once; up to `maxQueued` more wait for a worker, anything
+    beyond that is turned away with a 503 instead of piling up behind the pool.
+    """
+
+    def __init__(self, workers: int = 4, maxQueued: int = 64, rounds: int = 12):
+        self.workers = workers
+        self.maxQueued = maxQueued
+        self.rounds = rounds
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.reset()
+
+    @classmethod
+    def fromEnvironment(cls) -> "PasswordHashingPool":
+        return cls(
+            workers=_intSetting("BCRYPT_WORKERS", min(4, os.cpu_count() or 1)),
+            maxQueued=_intSetting("BCRYPT_MAX_QUEUED", 64),
+            rounds=_intSetting("BCRYPT_ROUNDS", 12),
+        )
+
+    def reset(self):
+        with self._lock:
+            self.queued = 0
+            self.maxQueuedSeen = 0
+            self.active = 0
+            self.completed = 0
+            self.rejected = 0
+            self.totalWaitSeconds = 0.0
+            self.maxWaitSeconds = 0.0
+            self.totalWorkSeconds = 0.0
+
+    def _getExecutor(self) -> ThreadPoolExecutor:
+        # Created on first use, so importing the app doesn't start threads.
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="bcrypt")
+        return self._executor
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def run(self, work: Callable[..., T], *args) -> T:
+        with self._lock:
+            if self.queued >= self.maxQueued:
+                self.rejected += 1
+                raise DomainErrorException.new(
+                    "PasswordHashing-E01", "Too many sign-ins at once, please try again.", 503
+                )
+            self.queued += 1
+            self.maxQueuedSeen = max(self.maxQueuedSeen, self.queued)
+        submittedAt = time.perf_counter()
+
+        def timed() -> T:
+            startedAt = time.perf_counter()
+            with self._lock:
+                self.queued -= 1
+                self.active += 1
+                waited = startedAt - submittedAt
+                self.totalWaitSeconds += waited
+                self.maxWaitSeconds = max(self.maxWaitSeconds, waited)
+            try:
+                return work(*args)
+            finally:
+                with self._lock:
+                    self.active -= 1
+                    self.completed += 1
+                    self.totalWorkSeconds += time.perf_counter() - startedAt
+
+        future = self._getExecutor().submit(timed)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # A queued hash for a request that went away shouldn't hold up the others.
+            if future.cancel():
+                with self._lock:
+                    self.queued -= 1
+            raise
+
+    def stats(self) -> PasswordHashingStatsDTO:
+        with self._lock:
+            return PasswordHashingStatsDTO(
+                workers=self.workers,
+                rounds=self.rounds,
+                queued=self.queued,
+                maxQueued=self.maxQueued,
+                maxQueuedSeen=self.maxQueuedSeen,
+                active=self.active,
+                completed=self.completed,
+                rejected=self.rejected,
+                averageWaitMs=self.totalWaitSeconds * 1000 / self.completed if self.completed else 0.0,
+                maxWaitMs=self.maxWaitSeconds * 1000,
+                averageHashMs=self.totalWorkSeconds * 1000 / self.completed if self.completed else 0.0,
+            )
+
+
+passwordHashingPool = PasswordHashingPool.fromEnvironment()
+
+
+async def hashPasswordAsync(password: str) -> str:
+    return await passwordHashingPool.run(hashPassword, password, passwordHashingPool.rounds)
+
+
+async def checkPasswordAsync(password: str, hashedPassword: str) -> bool:
+    return await passwordHashingPool.run(checkPassword, password, hashedPassword)
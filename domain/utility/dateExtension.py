@@ -0,0 +1,9 @@
+from datetime import datetime
+from typing import Optional
+
+
+def toMongoPrecision(value: Optional[datetime]) -> Optional[datetime]:
+    # BSON dates only keep milliseconds, so anything compared with a stored date is truncated the same way.
+    if value is None:
+        return None
+    return value.replace(microsecond=value.microsecond // 1000 * 1000)
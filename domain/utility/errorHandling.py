@@ -1,5 +1,5 @@
 from functools import wraps
-from quart import jsonify
+from quart import Response, jsonify
 from domain.domainError.domainError import DomainError
 from domain.domainError.domainErrorException import DomainErrorException
 from domain.logging.logger import Logger
@@ -33,6 +33,8 @@ def apiErrorHandling(func):
     async def wrapper(*args, **kwargs):
         try:
             result = await func(*args, **kwargs)
+            if isinstance(result, Response):
+                return result
             return jsonify(result)
         except DomainErrorException as de:
             Logger.error(de.domainError)
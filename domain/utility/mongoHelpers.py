@@ -1,6 +1,9 @@
-from typing import Type, List, TypeVar, Union
+from typing import Any, Iterable, Optional, Type, List, TypeVar, Union
+import bson
+from bson.codec_options import CodecOptions
 from pymongo.cursor import Cursor
 from pymongo.command_cursor import CommandCursor
+from pymongo.errors import BulkWriteError
 from domain.abstractEntity.abstractEntity import AbstractEntity
 
 T = TypeVar("T", bound=AbstractEntity)
@@ -8,4 +11,47 @@ T = TypeVar("T", bound=AbstractEntity)
 
 def serialize(cursor: Union[Cursor, CommandCursor], cls: Type[T]) -> List[T]:
     docs = list(cursor)
-    return [cls.fromDict(doc) for doc in docs]
+    return [cls.fromDocument(doc) for doc in docs]
+
+
+async def decodeRawBatches(
+    cursor: Any,
+    cls: Type[T],
+    codecOptions: CodecOptions,
+    fields: Optional[Iterable[str]] = None,
+) -> List[T]:
+    # For cursors from find_raw_batches: each server batch arrives as undecoded BSON and is decoded
+    # in one C call, then hydrated by the entity codec, instead of being pulled through the
+    # cursor one document at a time.
+    fromDocument = cls.fromDocument
+    entities: List[T] = []
+    async for batch in cursor:
+        entities.extend(
+            [fromDocument(document, fields) for document in bson.decode_all(batch, codecOptions)]
+        )
+    return entities
+
+
+async def unorderedBulkWrite(collection: Any, operations: list[Any]) -> dict[int, str]:
+    # Runs the operations in one unordered bulk_write and returns error messages keyed by operation index.
+    try:
+        await collection.bulk_write(operations, ordered=False)
+    except BulkWriteError as bwe:
+        return {
+            writeError["index"]: writeError.get("errmsg", "Write failed")
+            for writeError in bwe.details.get("writeErrors", [])
+        }
+    return {}
+
+
+def planStages(plan: Any) -> list[str]:
+    stages: list[str] = []
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.append(plan["stage"])
+        for value in plan.values():
+            stages.extend(planStages(value))
+    elif isinstance(plan, list):
+        for item in plan:
+            stages.extend(planStages(item))
+    return stages
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
-from quart_jwt_extended import get_jwt_identity
+from quart import g, has_app_context
+from quart_jwt_extended import get_jwt_identity, get_raw_jwt
 from domain.abstractEntity.baseEntity import BaseEntity
 
 
@@ -9,14 +11,36 @@ from domain.abstractEntity.baseEntity import BaseEntity
 class UserIdentity(BaseEntity):
     id: UUID
     roles: list[str]
+    # Guests only exist in their token until they first change something, so the token also
+    # carries what the guest was created with. Both are None for signed up users.
+    isGuest: bool = False
+    username: Optional[str] = None
+    createdDate: Optional[datetime] = None
 
 
 class UserProvider:
     @classmethod
-    def identity(cls) -> Optional[UserIdentity]:
+    def _current(cls) -> tuple[Optional[UserIdentity], frozenset[str]]:
+        # e.g. pymongo monitoring callbacks, which run on driver threads
+        if not has_app_context():
+            return None, frozenset()
+        # Built once per verified token and kept next to it on g, so every later call in the
+        # request is a lookup. Keyed on the token itself in case it's asked for before verification.
+        # Without a token get_raw_jwt gives a new {} each call, so that case is keyed on None.
+        jwt = get_raw_jwt() or None
+        memo = g.get("_userIdentity")
+        if memo is not None and memo[0] is jwt:
+            return memo[1], memo[2]
+        identity = None
         if jwtIdentity := get_jwt_identity():
-            return UserIdentity.fromDict(jwtIdentity)
-        return None
+            identity = UserIdentity.fromDict(jwtIdentity)
+        roles = frozenset(identity.roles) if identity is not None else frozenset()
+        g._userIdentity = (jwt, identity, roles)
+        return identity, roles
+
+    @classmethod
+    def identity(cls) -> Optional[UserIdentity]:
+        return cls._current()[0]
 
     @classmethod
     def userId(cls) -> UUID:
@@ -30,8 +54,18 @@ class UserProvider:
             return identity.roles
         return []
 
+    @classmethod
+    def roleSet(cls) -> frozenset[str]:
+        return cls._current()[1]
+
     @classmethod
     def matchOrBypass(cls, userId: UUID, bypassRoles: list[str] = []) -> bool:
         if identity := cls.identity():
-            return userId == identity.id or bool(set(identity.roles) & set(bypassRoles))
+            return userId == identity.id or not cls.roleSet().isdisjoint(bypassRoles)
+        return False
+
+    @classmethod
+    def isGuest(cls) -> bool:
+        if identity := cls.identity():
+            return identity.isGuest
         return False
@@ -0,0 +1,25 @@
+import hashlib
+import hmac
+import os
+import secrets
+from datetime import timedelta
+from uuid import UUID
+
+# Codes are only ever compared as keyed digests, so a leaked user document doesn't give the code away.
+VERIFICATION_CODE_SECRET = os.environ.get("VERIFICATION_CODE_SECRET", "supersecretverificationz").encode("utf-8")
+VERIFICATION_CODE_TTL = timedelta(minutes=int(os.environ.get("VERIFICATION_CODE_TTL_MINUTES", 30)))
+MAX_VERIFICATION_ATTEMPTS = 5
+
+
+def newVerificationCode() -> str:
+    return str(100_000_000 + secrets.randbelow(900_000_000))
+
+
+def verificationDigest(userId: UUID, code: str) -> str:
+    # Bound to the user, so the same code sent to two users gives two different digests.
+    message = userId.bytes + code.strip().encode("utf-8")
+    return hmac.new(VERIFICATION_CODE_SECRET, message, hashlib.sha256).hexdigest()
+
+
+def checkVerificationCode(userId: UUID, code: str, digest: str) -> bool:
+    return hmac.compare_digest(verificationDigest(userId, code), digest)
@@ -15,9 +15,11 @@ async def AddCommand(entity: T) -> Option[T]:
 
     entity.fillInfo()
 
-    result = await collection.insert_one(entity.toDict())
+    document = entity.toDict()
+    result = await collection.insert_one(document)
 
     if result.acknowledged and result.inserted_id:
+        entity.markPersisted(document)
         return Option(entity)
     else:
         error = DomainError(
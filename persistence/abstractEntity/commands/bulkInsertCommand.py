@@ -0,0 +1,62 @@
+from datetime import datetime
+from typing import TypeVar
+from pymongo import InsertOne
+from domain.DTOs.bulkItemResultDTO import BulkItemResultDTO
+from domain.abstractEntity.abstractEntity import AbstractEntity
+from domain.domainError.domainError import DomainError
+from domain.utility.mongoHelpers import unorderedBulkWrite
+from persistence.abstractEntity.commands.bulkUpsertCommand import BULK_CHUNK_SIZE
+from persistence.dbClient import getDb
+from domain.option.option import Option
+from domain.utility.errorHandling import serviceErrorHandling
+from domain.utility.userProvider import UserProvider
+
+T = TypeVar("T", bound=AbstractEntity)
+
+
+@serviceErrorHandling
+async def BulkInsertCommand(
+    entities: list[T], chunkSize: int = BULK_CHUNK_SIZE
+) -> Option[list[BulkItemResultDTO]]:
+    if not entities:
+        return Option([])
+    entity_type = type(entities[0])
+    if any(type(entity) is not entity_type for entity in entities):
+        return Option.Error(
+            DomainError(
+                "BulkInsertCommand-E01", "All entities must be of the same type.", status=400
+            )
+        )
+    if any(entity.isPartial() for entity in entities):
+        return Option.Error(
+            DomainError(
+                "BulkInsertCommand-E02", "Partially loaded entities cannot be inserted.", status=400
+            )
+        )
+    collection = getDb()[entity_type.getCollectionName()]
+
+    # One user and timestamp for the whole batch
+    userId = UserProvider.userId()
+    now = datetime.utcnow()
+    results: list[BulkItemResultDTO] = []
+    for start in range(0, len(entities), chunkSize):
+        chunk = entities[start : start + chunkSize]
+        operations = []
+        documents = []
+        for entity in chunk:
+            entity.fillInfo(userId, now)
+            document = entity.toDict()
+            document["_id"] = entity.id
+            documents.append(document)
+            operations.append(InsertOne(document))
+
+        errors = await unorderedBulkWrite(collection, operations)
+        for offset, entity in enumerate(chunk):
+            error = errors.get(offset)
+            if error is None:
+                entity.markPersisted(documents[offset])
+            results.append(
+                BulkItemResultDTO(start + offset, entity.id, error is None, error)
+            )
+
+    return Option(results)
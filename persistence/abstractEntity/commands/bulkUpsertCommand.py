@@ -0,0 +1,67 @@
+from datetime import datetime
+from typing import TypeVar
+from pymongo import ReplaceOne, UpdateOne
+from domain.DTOs.bulkItemResultDTO import BulkItemResultDTO
+from domain.abstractEntity.abstractEntity import AbstractEntity
+from domain.domainError.domainError import DomainError
+from domain.utility.mongoHelpers import unorderedBulkWrite
+from persistence.dbClient import getDb
+from domain.option.option import Option
+from domain.utility.errorHandling import serviceErrorHandling
+from domain.utility.userProvider import UserProvider
+
+T = TypeVar("T", bound=AbstractEntity)
+
+BULK_CHUNK_SIZE = 500
+
+
+@serviceErrorHandling
+async def BulkUpsertCommand(
+    entities: list[T], chunkSize: int = BULK_CHUNK_SIZE
+) -> Option[list[BulkItemResultDTO]]:
+    if not entities:
+        return Option([])
+    entity_type = type(entities[0])
+    if any(type(entity) is not entity_type for entity in entities):
+        return Option.Error(
+            DomainError(
+                "BulkUpsertCommand-E01", "All entities must be of the same type.", status=400
+            )
+        )
+    if any(entity.isPartial() and not entity.isPersisted() for entity in entities):
+        return Option.Error(
+            DomainError(
+                "BulkUpsertCommand-E02", "Partially loaded entities can only be updated.", status=400
+            )
+        )
+    collection = getDb()[entity_type.getCollectionName()]
+
+    # One user and timestamp for the whole batch
+    userId = UserProvider.userId()
+    now = datetime.utcnow()
+    results: list[BulkItemResultDTO] = []
+    for start in range(0, len(entities), chunkSize):
+        chunk = entities[start : start + chunkSize]
+        operations = []
+        documents = []
+        for entity in chunk:
+            entity.fillInfo(userId, now)
+            document = entity.toDict()
+            documents.append(document)
+            changes = entity.getChanges() if entity.isPersisted() else None
+            if changes:
+                # No upsert here, a partial update must not create a partial document
+                operations.append(UpdateOne({"_id": entity.id}, changes))
+            else:
+                operations.append(ReplaceOne({"_id": entity.id}, document, upsert=True))
+
+        errors = await unorderedBulkWrite(collection, operations)
+        for offset, entity in enumerate(chunk):
+            error = errors.get(offset)
+            if error is None:
+                entity.markPersisted(documents[offset])
+            results.append(
+                BulkItemResultDTO(start + offset, entity.id, error is None, error)
+            )
+
+    return Option(results)
@@ -0,0 +1,63 @@
+from datetime import datetime
+from typing import Any, Type, TypeVar
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from domain.abstractEntity.abstractEntity import AbstractEntity
+from domain.domainError.domainError import DomainError
+from domain.utility.userProvider import UserProvider
+from persistence.dbClient import getDb
+from domain.option.option import Option
+from domain.utility.errorHandling import serviceErrorHandling
+
+T = TypeVar("T", bound=AbstractEntity)
+
+NOT_MATCHED_ERROR = "FindOneAndUpdateCommand-E01"
+DUPLICATE_KEY_ERROR = "FindOneAndUpdateCommand-E02"
+
+
+@serviceErrorHandling
+async def FindOneAndUpdateCommand(
+    type: Type[T], query: dict[str, Any], update: dict[str, Any]
+) -> Option[T]:
+    """
+    Applies a server-side update to the single document matching query and returns it as updated,
+    in one round trip. Conditions belong in the query; no match gives NOT_MATCHED_ERROR and a
+    unique index violation gives DUPLICATE_KEY_ERROR with the DuplicateKeyError attached.
+    """
+    collection = getDb()[type.getCollectionName()]
+
+    setFields = dict(update.get("$set", {}))
+    setFields["updatedDate"] = datetime.utcnow()
+    setFields["updatedBy"] = UserProvider.userId()
+    update = {**update, "$set": setFields}
+
+    try:
+        document = await collection.find_one_and_update(
+            query, update, return_document=ReturnDocument.AFTER
+        )
+    except DuplicateKeyError as dke:
+        return Option.Error(
+            DomainError(DUPLICATE_KEY_ERROR, f"{type.__name__} already exists.", dke, 409)
+        )
+
+    if document is None:
+        return Option.Error(
+            DomainError(NOT_MATCHED_ERROR, f"Couldn't find {type.__name__} to update.")
+        )
+
+    return Option(type.fromDocument(document))
+
+
+def duplicateKeyFields(error: DomainError) -> set[str]:
+    # Which unique fields caused a DUPLICATE_KEY_ERROR, from the server's keyValue when present.
+    dke = error.exception
+    if not isinstance(dke, DuplicateKeyError):
+        return set()
+    keyValue = (dke.details or {}).get("keyValue")
+    if keyValue:
+        return set(keyValue)
+    return {
+        word.split("_")[0]
+        for word in str(dke).replace(":", " ").split()
+        if word.endswith("_1") or word.endswith("_-1")
+    }
@@ -0,0 +1,38 @@
+from typing import TypeVar
+from pymongo.errors import DuplicateKeyError
+from domain.abstractEntity.abstractEntity import AbstractEntity
+from domain.domainError.domainError import DomainError
+from persistence.dbClient import getDb
+from domain.option.option import Option
+from domain.utility.errorHandling import serviceErrorHandling
+
+T = TypeVar("T", bound=AbstractEntity)
+
+
+@serviceErrorHandling
+async def InsertIfMissingCommand(entity: T) -> Option[bool]:
+    """
+    Inserts the entity unless a document with its id already exists, which is left untouched.
+    One round trip either way; the result says whether this call inserted it.
+    """
+    entity_type = type(entity)
+    collection = getDb()[entity_type.getCollectionName()]
+
+    entity.fillInfo()
+
+    document = entity.toDict()
+    try:
+        result = await collection.update_one(
+            {"_id": entity.id}, {"$setOnInsert": document}, upsert=True
+        )
+    except DuplicateKeyError as dke:
+        return Option.Error(
+            DomainError(
+                "InsertIfMissingCommand-E01", f"{entity_type.__name__} already exists.", dke, 409
+            )
+        )
+
+    if result.upserted_id is not None:
+        entity.markPersisted(document)
+        return Option(True)
+    return Option(False)
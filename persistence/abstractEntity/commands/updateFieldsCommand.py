@@ -0,0 +1,31 @@
+from typing import TypeVar
+from domain.abstractEntity.abstractEntity import AbstractEntity
+from domain.domainError.domainError import DomainError
+from persistence.dbClient import getDb
+from domain.option.option import Option
+from domain.utility.errorHandling import serviceErrorHandling
+
+T = TypeVar("T", bound=AbstractEntity)
+
+
+@serviceErrorHandling
+async def UpdateFieldsCommand(entity: T) -> Option[T]:
+    entity_type = type(entity)
+    collection = getDb()[entity_type.getCollectionName()]
+
+    entity.fillInfo()
+
+    update = entity.getChanges()
+    if update:
+        query = {"_id": entity.id}
+        result = await collection.update_one(query, update)
+        if result.matched_count == 0:
+            return Option.Error(
+                DomainError(
+                    "UpdateFieldsCommand-E01",
+                    f"Could not find {entity_type.__name__} to update.",
+                )
+            )
+
+    entity.markPersisted(entity.toDict())
+    return Option(entity)
@@ -1,6 +1,7 @@
 from typing import TypeVar
 from domain.abstractEntity.abstractEntity import AbstractEntity
 from domain.domainError.domainError import DomainError
+from persistence.abstractEntity.commands.updateFieldsCommand import UpdateFieldsCommand
 from persistence.dbClient import getDb
 from domain.option.option import Option
 from domain.utility.errorHandling import serviceErrorHandling
@@ -10,15 +11,33 @@ T = TypeVar("T", bound=AbstractEntity)
 
 @serviceErrorHandling
 async def UpsertByIdCommand(entity: T) -> Option[T]:
+    # Entities loaded from the database only send the fields that changed
+    if entity.isPersisted():
+        updateResult = await UpdateFieldsCommand(entity)
+        if updateResult.isSome() or entity.isPartial():
+            return updateResult
+
+    # Replacing with a partially loaded entity would drop every field it didn't load.
+    if entity.isPartial():
+        return Option.Error(
+            DomainError(
+                "UpsertByIdCommand-E02",
+                f"Cannot replace {type(entity).__name__} from a partially loaded entity.",
+                status=400,
+            )
+        )
+
     entity_type = type(entity)
     collection = getDb()[entity_type.getCollectionName()]
 
     entity.fillInfo()
 
     query = {"_id": entity.id}
-    result = await collection.replace_one(query, entity.toDict(), upsert=True)
+    document = entity.toDict()
+    result = await collection.replace_one(query, document, upsert=True)
 
     if result.upserted_id or result.matched_count > 0:
+        entity.markPersisted(document)
         return Option(entity)
     else:
         error = DomainError(
@@ -0,0 +1,102 @@
+from __future__ import annotations
+import asyncio
+from typing import Awaitable, Callable, Generic, Optional, Type, TypeVar
+from uuid import UUID
+
+from quart import g, has_request_context
+
+from domain.abstractEntity.abstractEntity import AbstractEntity
+from domain.option.option import Option
+
+T = TypeVar("T", bound=AbstractEntity)
+
+FetchMany = Callable[[list[UUID]], Awaitable[Option[list[T]]]]
+
+
+class EntityLoader(Generic[T]):
+    """
+    DataLoader-style batcher for id lookups, one per entity type per request.
+    Ids requested within the same event-loop tick are fetched with a single query,
+    and every entity seen during the request is kept in an identity map.
+    """
+
+    entityType: Type[T]
+    fetchMany: FetchMany
+    identityMap: dict[UUID, Optional[T]]
+    pending: dict[UUID, asyncio.Future]
+    dispatchScheduled: bool
+    # The loop only keeps weak references to tasks, so in-flight fetches are held here.
+    fetchTasks: set[asyncio.Task]
+
+    def __init__(self, entityType: Type[T], fetchMany: FetchMany):
+        self.entityType = entityType
+        self.fetchMany = fetchMany
+        self.identityMap = {}
+        self.pending = {}
+        self.dispatchScheduled = False
+        self.fetchTasks = set()
+
+    @classmethod
+    def forType(
+        cls, entityType: Type[T], fetchMany: FetchMany
+    ) -> Optional[EntityLoader[T]]:
+        # Outside of a request there's nothing to scope the identity map to.
+        if not has_request_context():
+            return None
+        loaders: Optional[dict[type, EntityLoader]] = g.get("_entityLoaders")
+        if loaders is None:
+            loaders = {}
+            g._entityLoaders = loaders
+        loader = loaders.get(entityType)
+        if loader is None:
+            loader = cls(entityType, fetchMany)
+            loaders[entityType] = loader
+        return loader
+
+    async def load(self, id: UUID) -> Optional[T]:
+        if id in self.identityMap:
+            return self.identityMap[id]
+
+        future = self.pending.get(id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self.pending[id] = future
+            if not self.dispatchScheduled:
+                self.dispatchScheduled = True
+                loop.call_soon(self._dispatch)
+        return await future
+
+    async def loadMany(self, ids: list[UUID]) -> list[Optional[T]]:
+        return list(await asyncio.gather(*[self.load(id) for id in ids]))
+
+    def prime(self, id: UUID, entity: Optional[T]):
+        self.identityMap[id] = entity
+
+    def clear(self, id: UUID):
+        self.identityMap.pop(id, None)
+
+    def _dispatch(self):
+        batch = self.pending
+        self.pending = {}
+        self.dispatchScheduled = False
+        task = asyncio.ensure_future(self._fetchBatch(batch))
+        self.fetchTasks.add(task)
+        task.add_done_callback(self.fetchTasks.discard)
+
+    async def _fetchBatch(self, batch: dict[UUID, asyncio.Future]):
+        try:
+            result = await self.fetchMany(list(batch.keys()))
+            entities = result.valueOrThrow()
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        found = {entity.id: entity for entity in entities}
+        for id, future in batch.items():
+            entity = found.get(id)
+            self.identityMap[id] = entity
+            if not future.done():
+                future.set_result(entity)
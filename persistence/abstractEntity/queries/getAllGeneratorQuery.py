@@ -1,5 +1,6 @@
-from typing import Type, TypeVar, AsyncGenerator
+from typing import Optional, Type, TypeVar, AsyncGenerator
 from domain.abstractEntity.abstractEntity import AbstractEntity
+from domain.abstractEntity.projection import Projection
 from persistence.dbClient import getDb
 from domain.option.option import Option
 from domain.utility.errorHandling import serviceErrorHandling
@@ -8,14 +9,19 @@ T = TypeVar("T", bound=AbstractEntity)
 
 
 @serviceErrorHandling
-async def GetAllGeneratorQuery(type: Type[T]) -> Option[AsyncGenerator[T, None]]:
+async def GetAllGeneratorQuery(
+    type: Type[T], batchSize: int = 500, projection: Optional[Projection] = None
+) -> Option[AsyncGenerator[T, None]]:
     collection = getDb()[type.getCollectionName()]
     query = {}
-    cursor = collection.find(query)
+    cursor = collection.find(
+        query, projection.mongoProjection() if projection else None
+    ).batch_size(batchSize)
+    fields = projection.fields if projection else None
 
     async def generator() -> AsyncGenerator[T, None]:
         async for document in cursor:
-            serialized_object = type.fromDict(document)
+            serialized_object = type.fromDocument(document, fields)
             yield serialized_object
 
     return Option(generator())
\ No newline at end of file
@@ -1,5 +1,7 @@
-from typing import Type, TypeVar
+from typing import Optional, Type, TypeVar
 from domain.abstractEntity.abstractEntity import AbstractEntity
+from domain.abstractEntity.projection import Projection
+from domain.utility.mongoHelpers import decodeRawBatches
 from persistence.dbClient import getDb
 from domain.option.option import Option
 from domain.utility.errorHandling import serviceErrorHandling
@@ -8,14 +10,21 @@ T = TypeVar("T", bound=AbstractEntity)
 
 
 @serviceErrorHandling
-async def GetAllQuery(type: Type[T]) -> Option[list[T]]:
+async def GetAllQuery(
+    type: Type[T], projection: Optional[Projection] = None, rawBatches: bool = False
+) -> Option[list[T]]:
     collection = getDb()[type.getCollectionName()]
     query = {}
-    cursor = collection.find(query)
+    find = collection.find_raw_batches if rawBatches else collection.find
+    cursor = find(query, projection.mongoProjection() if projection else None)
+    fields = projection.fields if projection else None
+
+    if rawBatches:
+        return Option(await decodeRawBatches(cursor, type, collection.codec_options, fields))
 
     serialized_objects = []
     async for document in cursor:
-        serialized_object = type.fromDict(document)
+        serialized_object = type.fromDocument(document, fields)
         serialized_objects.append(serialized_object)
 
     return Option(serialized_objects)
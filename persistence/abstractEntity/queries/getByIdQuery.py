@@ -1,6 +1,7 @@
-from typing import Type, TypeVar
+from typing import Optional, Type, TypeVar
 from uuid import UUID
 from domain.abstractEntity.abstractEntity import AbstractEntity
+from domain.abstractEntity.projection import Projection
 from domain.domainError.domainError import DomainError
 from domain.utility.mongoHelpers import serialize
 from persistence.dbClient import getDb
@@ -11,12 +12,17 @@ T = TypeVar("T", bound=AbstractEntity)
 
 
 @serviceErrorHandling
-async def GetByIdQuery(type: Type[T], id: UUID) -> Option[T]:
+async def GetByIdQuery(
+    type: Type[T], id: UUID, projection: Optional[Projection] = None
+) -> Option[T]:
     collection = getDb()[type.getCollectionName()]
     query = {"_id": {"$eq": id}}
-    cursor = collection.find(query).limit(1)
+    cursor = collection.find(
+        query, projection.mongoProjection() if projection else None
+    ).limit(1)
+    fields = projection.fields if projection else None
 
     async for document in cursor:
-        return Option(type.fromDict(document))
+        return Option(type.fromDocument(document, fields))
 
     return Option.Error(DomainError("GetByIdQuery", f"Couldn't find {type.__name__} by id."))
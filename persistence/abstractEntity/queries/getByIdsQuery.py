@@ -1,6 +1,7 @@
-from typing import Type, TypeVar
+from typing import Optional, Type, TypeVar
 from uuid import UUID
 from domain.abstractEntity.abstractEntity import AbstractEntity
+from domain.abstractEntity.projection import Projection
 from domain.utility.mongoHelpers import serialize
 from persistence.dbClient import getDb
 from domain.option.option import Option
@@ -10,14 +11,17 @@ T = TypeVar("T", bound=AbstractEntity)
 
 
 @serviceErrorHandling
-async def GetByIdsQuery(type: Type[T], ids: list[UUID]) -> Option[list[T]]:
+async def GetByIdsQuery(
+    type: Type[T], ids: list[UUID], projection: Optional[Projection] = None
+) -> Option[list[T]]:
     collection = getDb()[type.getCollectionName()]
     query = {"_id": {"$in": ids}}
-    cursor = collection.find(query)
+    cursor = collection.find(query, projection.mongoProjection() if projection else None)
+    fields = projection.fields if projection else None
 
     serialized_objects = []
     async for document in cursor:
-        serialized_object = type.fromDict(document)
+        serialized_object = type.fromDocument(document, fields)
         serialized_objects.append(serialized_object)
 
     return Option(serialized_objects)
@@ -1,8 +1,9 @@
 from datetime import datetime
-from typing import Type, TypeVar
+from typing import Optional, Type, TypeVar
 from uuid import UUID
 from domain.abstractEntity.abstractEntity import AbstractEntity
-from domain.utility.mongoHelpers import serialize
+from domain.abstractEntity.projection import Projection
+from domain.utility.mongoHelpers import decodeRawBatches, serialize
 from persistence.dbClient import getDb
 from domain.option.option import Option
 from domain.utility.errorHandling import serviceErrorHandling
@@ -12,15 +13,26 @@ T = TypeVar("T", bound=AbstractEntity)
 
 @serviceErrorHandling
 async def GetByTimespanQuery(
-    type: Type[T], startDate: datetime, endDate: datetime
+    type: Type[T],
+    startDate: datetime,
+    endDate: datetime,
+    projection: Optional[Projection] = None,
+    rawBatches: bool = False,
 ) -> Option[list[T]]:
     collection = getDb()[type.getCollectionName()]
     query = {"createdDate": {"$gt": startDate, "$lte": endDate}}
-    cursor = collection.find(query).sort("createdDate", -1)
+    find = collection.find_raw_batches if rawBatches else collection.find
+    cursor = find(
+        query, projection.mongoProjection() if projection else None
+    ).sort("createdDate", -1)
+    fields = projection.fields if projection else None
+
+    if rawBatches:
+        return Option(await decodeRawBatches(cursor, type, collection.codec_options, fields))
 
     serialized_objects = []
     async for document in cursor:
-        serialized_object = type.fromDict(document)
+        serialized_object = type.fromDocument(document, fields)
         serialized_objects.append(serialized_object)
 
     return Option(serialized_objects)
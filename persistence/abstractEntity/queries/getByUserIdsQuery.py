@@ -1,6 +1,8 @@
-from typing import Type, TypeVar
+from typing import Optional, Type, TypeVar
 from uuid import UUID
 from domain.abstractEntity.abstractEntity import AbstractEntity
+from domain.abstractEntity.projection import Projection
+from domain.utility.mongoHelpers import decodeRawBatches
 from persistence.dbClient import getDb
 from domain.option.option import Option
 from domain.utility.errorHandling import serviceErrorHandling
@@ -10,14 +12,26 @@ T = TypeVar('T', bound=AbstractEntity)
 # Note that this only works when there's a userId field.
 
 @serviceErrorHandling
-async def GetByUserIdsQuery(type: Type[T], userIds: list[UUID]) -> Option[list[T]]:
+async def GetByUserIdsQuery(
+    type: Type[T],
+    userIds: list[UUID],
+    projection: Optional[Projection] = None,
+    rawBatches: bool = False,
+) -> Option[list[T]]:
     collection = getDb()[type.getCollectionName()]
     query = {"userId": {"$in": userIds}}
-    cursor = collection.find(query).sort([('createdDate', -1)])
+    find = collection.find_raw_batches if rawBatches else collection.find
+    cursor = find(
+        query, projection.mongoProjection() if projection else None
+    ).sort([('createdDate', -1)])
+    fields = projection.fields if projection else None
+
+    if rawBatches:
+        return Option(await decodeRawBatches(cursor, type, collection.codec_options, fields))
 
     serialized_objects = []
     async for document in cursor:
-        serialized_object = type.fromDict(document)
+        serialized_object = type.fromDocument(document, fields)
         serialized_objects.append(serialized_object)
 
     return Option(serialized_objects)
@@ -0,0 +1,29 @@
+from typing import Type, TypeVar
+from domain.DTOs.entityVersionDTO import EntityVersionDTO
+from domain.abstractEntity.abstractEntity import AbstractEntity
+from persistence.dbClient import getDb
+from domain.option.option import Option
+from domain.utility.errorHandling import serviceErrorHandling
+
+T = TypeVar("T", bound=AbstractEntity)
+
+UPDATED_DATE_INDEX = [("updatedDate", -1)]
+
+
+@serviceErrorHandling
+async def GetCollectionVersionQuery(type: Type[T]) -> Option[EntityVersionDTO]:
+    collection = getDb()[type.getCollectionName()]
+    # Inserts and updates move the newest updatedDate, deletes move the count. The count comes from
+    # collection metadata and the newest updatedDate from the first key of its index.
+    count = await collection.estimated_document_count()
+    cursor = (
+        collection.find({}, {"_id": 0, "updatedDate": 1})
+        .sort(UPDATED_DATE_INDEX)
+        .hint(UPDATED_DATE_INDEX)
+        .limit(1)
+    )
+
+    updatedDate = None
+    async for document in cursor:
+        updatedDate = document.get("updatedDate")
+    return Option(EntityVersionDTO.forCollection(count, updatedDate))
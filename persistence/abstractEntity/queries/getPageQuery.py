@@ -0,0 +1,73 @@
+from typing import Any, Optional, Type, TypeVar
+from domain.abstractEntity.abstractEntity import AbstractEntity
+from domain.abstractEntity.projection import Projection
+from domain.pagination.page import Page, PageRequest, decodeCursor, encodeCursor
+from persistence.dbClient import getDb
+from domain.option.option import Option
+from domain.utility.errorHandling import serviceErrorHandling
+
+T = TypeVar("T", bound=AbstractEntity)
+
+# Keyset pagination over (createdDate, _id), newest first.
+# "after" continues towards older entities, "before" goes back towards newer ones.
+
+
+@serviceErrorHandling
+async def GetPageQuery(
+    type: Type[T],
+    page: PageRequest,
+    query: Optional[dict[str, Any]] = None,
+    projection: Optional[Projection] = None,
+) -> Option[Page[T]]:
+    collection = getDb()[type.getCollectionName()]
+
+    cursorValue = page.before if page.isBackward() else page.after
+    filters: list[dict[str, Any]] = [query] if query else []
+    if cursorValue is not None:
+        createdDate, id = decodeCursor(cursorValue)
+        comparison = "$gt" if page.isBackward() else "$lt"
+        filters.append(
+            {
+                "$or": [
+                    {"createdDate": {comparison: createdDate}},
+                    {"createdDate": createdDate, "_id": {comparison: id}},
+                ]
+            }
+        )
+
+    # Cursors are built from createdDate and id, so those are always loaded.
+    projection = projection.including("createdDate") if projection else None
+    fields = projection.fields if projection else None
+
+    direction = 1 if page.isBackward() else -1
+    cursor = (
+        collection.find(
+            {"$and": filters} if filters else {},
+            projection.mongoProjection() if projection else None,
+        )
+        .sort([("createdDate", direction), ("_id", direction)])
+        .limit(page.limit + 1)
+    )
+
+    serialized_objects = []
+    async for document in cursor:
+        serialized_object = type.fromDocument(document, fields)
+        serialized_objects.append(serialized_object)
+
+    hasMore = len(serialized_objects) > page.limit
+    items = serialized_objects[: page.limit]
+    if page.isBackward():
+        items.reverse()
+
+    def cursorOf(entity: T) -> str:
+        return encodeCursor(entity.createdDate, entity.id)
+
+    nextCursor = None
+    prevCursor = None
+    if items:
+        if hasMore or page.isBackward():
+            nextCursor = cursorOf(items[-1])
+        if page.after is not None or (page.isBackward() and hasMore):
+            prevCursor = cursorOf(items[0])
+
+    return Option(Page(items, nextCursor, prevCursor))
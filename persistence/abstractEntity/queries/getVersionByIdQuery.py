@@ -0,0 +1,30 @@
+from typing import Type, TypeVar
+from uuid import UUID
+from domain.DTOs.entityVersionDTO import EntityVersionDTO
+from domain.abstractEntity.abstractEntity import AbstractEntity
+from domain.domainError.domainError import DomainError
+from persistence.dbClient import getDb
+from domain.option.option import Option
+from domain.utility.errorHandling import serviceErrorHandling
+
+T = TypeVar("T", bound=AbstractEntity)
+
+VERSION_INDEX = [("_id", 1), ("updatedDate", -1)]
+
+
+@serviceErrorHandling
+async def GetVersionByIdQuery(type: Type[T], id: UUID) -> Option[EntityVersionDTO]:
+    collection = getDb()[type.getCollectionName()]
+    # Covered by the (_id, updatedDate) index, so the document itself is never fetched.
+    cursor = (
+        collection.find({"_id": {"$eq": id}}, {"_id": 1, "updatedDate": 1})
+        .hint(VERSION_INDEX)
+        .limit(1)
+    )
+
+    async for document in cursor:
+        return Option(EntityVersionDTO.forEntity(id, document.get("updatedDate")))
+
+    return Option.Error(
+        DomainError("GetVersionByIdQuery", f"Couldn't find {type.__name__} by id.")
+    )
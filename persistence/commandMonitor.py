@@ -0,0 +1,269 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Optional
+
+import bson
+from pymongo import monitoring
+
+from domain.DTOs.commandStatsDTO import CommandStatsDTO, QueryShapeStatsDTO, SlowCommandDTO
+from domain.logging.logger import Logger
+from domain.utility.mongoHelpers import planStages
+
+HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+MAX_SHAPES_PER_COMMAND = 100
+SLOW_COMMAND_HISTORY = 100
+
+# Handshakes, auth and our own explains would only drown out the application's commands.
+IGNORED_COMMANDS = frozenset(
+    {
+        "hello",
+        "ismaster",
+        "isMaster",
+        "ping",
+        "buildInfo",
+        "saslStart",
+        "saslContinue",
+        "endSessions",
+        "killCursors",
+        "explain",
+    }
+)
+EXPLAINABLE_COMMANDS = frozenset(
+    {"find", "aggregate", "count", "distinct", "update", "delete", "findAndModify"}
+)
+_UNEXPLAINABLE_FIELDS = frozenset(
+    {"$db", "lsid", "$clusterTime", "$readPreference", "txnNumber", "signature"}
+)
+
+
+def normalizeShape(value: Any) -> Any:
+    # Keeps field names and operators, replaces every literal with "?".
+    if isinstance(value, dict):
+        return {
+            key: (item if key == "$sort" else normalizeShape(item))
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        if any(isinstance(item, (dict, list)) for item in value):
+            return [normalizeShape(item) for item in value]
+        return ["?"] if value else []
+    return "?"
+
+
+def commandShape(commandName: str, command: dict[str, Any]) -> str:
+    parts: dict[str, Any] = {}
+    if commandName == "find":
+        parts["filter"] = normalizeShape(command.get("filter", {}))
+        if command.get("sort"):
+            parts["sort"] = command["sort"]
+    elif commandName in ("count", "distinct"):
+        parts["filter"] = normalizeShape(command.get("query", {}))
+        if commandName == "distinct":
+            parts["key"] = command.get("key")
+    elif commandName == "aggregate":
+        parts["pipeline"] = normalizeShape(command.get("pipeline", []))
+    elif commandName == "findAndModify":
+        parts["filter"] = normalizeShape(command.get("query", {}))
+        if command.get("sort"):
+            parts["sort"] = command["sort"]
+    elif commandName in ("update", "delete"):
+        statements = command.get("updates" if commandName == "update" else "deletes") or []
+        if statements:
+            parts["filter"] = normalizeShape(statements[0].get("q", {}))
+    if not parts:
+        return ""
+    return json.dumps(parts, separators=(",", ":"), default=str)
+
+
+def replyDocuments(reply: dict[str, Any]) -> int:
+    cursor = reply.get("cursor")
+    if isinstance(cursor, dict):
+        return len(cursor.get("firstBatch") or cursor.get("nextBatch") or [])
+    if "value" in reply:
+        return 0 if reply["value"] is None else 1
+    n = reply.get("n")
+    return n if isinstance(n, int) else 0
+
+
+class _CommandHistogram:
+    def __init__(self):
+        self.count = 0
+        self.failures = 0
+        self.totalMs = 0.0
+        self.maxMs = 0.0
+        self.documents = 0
+        self.bytes = 0
+        self.buckets = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.shapes: dict[str, list[float]] = {}
+
+    def record(self, durationMs: float, documents: int, size: int, shape: str, failed: bool):
+        self.count += 1
+        self.failures += failed
+        self.totalMs += durationMs
+        self.maxMs = max(self.maxMs, durationMs)
+        self.documents += documents
+        self.bytes += size
+        bucket = next(
+            (i for i, bound in enumerate(HISTOGRAM_BOUNDS_MS) if durationMs <= bound),
+            len(HISTOGRAM_BOUNDS_MS),
+        )
+        self.buckets[bucket] += 1
+        if shape:
+            shapeStats = self.shapes.get(shape)
+            if shapeStats is None:
+                if len(self.shapes) >= MAX_SHAPES_PER_COMMAND:
+                    return
+                shapeStats = self.shapes[shape] = [0, 0.0, 0.0]
+            shapeStats[0] += 1
+            shapeStats[1] += durationMs
+            shapeStats[2] = max(shapeStats[2], durationMs)
+
+
+class CommandMonitor(monitoring.CommandListener):
+    """
+    Aggregates every Mongo command into per-collection, per-operation latency histograms, with the
+    normalized query shapes seen for each. Commands slower than DB_SLOW_COMMAND_MS are logged and
+    kept in a short history; with DB_SLOW_COMMAND_EXPLAIN=true their query plan is captured too.
+    Reply sizes mean re-encoding every reply on the driver thread, so bytes stays 0 unless
+    DB_MEASURE_REPLY_BYTES=true.
+    """
+
+    def __init__(self):
+        self.slowCommandMs = float(os.environ.get("DB_SLOW_COMMAND_MS", 100))
+        self.explainSlowCommands = (
+            os.environ.get("DB_SLOW_COMMAND_EXPLAIN", "false").lower() == "true"
+        )
+        self.measureReplyBytes = (
+            os.environ.get("DB_MEASURE_REPLY_BYTES", "false").lower() == "true"
+        )
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.client: Any = None
+        self._lock = threading.Lock()
+        self._pending: dict[tuple[int, Any], tuple[str, str, str, Optional[dict[str, Any]]]] = {}
+        self.reset()
+
+    def attach(self, loop: asyncio.AbstractEventLoop, client: Any):
+        # Explains run as regular commands on the serving loop, so they need both.
+        self.loop = loop
+        self.client = client
+
+    def reset(self):
+        with self._lock:
+            self._histograms: dict[tuple[str, str], _CommandHistogram] = {}
+            self._slowCommands: deque[SlowCommandDTO] = deque(maxlen=SLOW_COMMAND_HISTORY)
+
+    def started(self, event):
+        commandName = event.command_name
+        if commandName in IGNORED_COMMANDS:
+            return
+        command = event.command
+        if commandName == "getMore":
+            collection = command.get("collection", "")
+        else:
+            collection = command.get(commandName, "")
+        if not isinstance(collection, str):
+            collection = ""
+        explainCommand = None
+        if self.explainSlowCommands and commandName in EXPLAINABLE_COMMANDS:
+            explainCommand = {
+                key: value for key, value in command.items() if key not in _UNEXPLAINABLE_FIELDS
+            }
+        with self._lock:
+            self._pending[(event.request_id, event.connection_id)] = (
+                collection,
+                commandName,
+                commandShape(commandName, command),
+                explainCommand,
+            )
+
+    def succeeded(self, event):
+        self._finish(event, event.reply, False)
+
+    def failed(self, event):
+        self._finish(event, {}, True)
+
+    def _finish(self, event, reply: dict[str, Any], failed: bool):
+        with self._lock:
+            pending = self._pending.pop((event.request_id, event.connection_id), None)
+        if pending is None:
+            return
+        collection, commandName, shape, explainCommand = pending
+        durationMs = event.duration_micros / 1000
+        documents = replyDocuments(reply)
+        size = 0
+        if self.measureReplyBytes and reply:
+            try:
+                size = len(bson.encode(reply))
+            except Exception:
+                pass
+
+        with self._lock:
+            histogram = self._histograms.get((collection, commandName))
+            if histogram is None:
+                histogram = self._histograms[(collection, commandName)] = _CommandHistogram()
+            histogram.record(durationMs, documents, size, shape, failed)
+
+        if durationMs >= self.slowCommandMs:
+            slowCommand = SlowCommandDTO(
+                datetime.utcnow(), collection, commandName, shape, durationMs, documents, None
+            )
+            with self._lock:
+                self._slowCommands.append(slowCommand)
+            Logger.warning(
+                "MongoCommand-Slow",
+                f"Slow {commandName} on {collection} took {durationMs:.1f}ms",
+                slowCommand.toDict(True),
+            )
+            if explainCommand is not None and self.loop is not None and not self.loop.is_closed():
+                asyncio.run_coroutine_threadsafe(
+                    self._explain(slowCommand, event.database_name, explainCommand), self.loop
+                )
+
+    async def _explain(self, slowCommand: SlowCommandDTO, databaseName: str, command: dict[str, Any]):
+        try:
+            explanation = await self.client[databaseName].command(
+                {"explain": command, "verbosity": "queryPlanner"}
+            )
+            slowCommand.explainStages = planStages(
+                explanation.get("queryPlanner", {}).get("winningPlan", {})
+            )
+        except Exception as e:
+            Logger.warning("MongoCommand-Explain", f"Could not explain slow {slowCommand.operation}: {e}")
+
+    def stats(self) -> list[CommandStatsDTO]:
+        with self._lock:
+            histograms = sorted(self._histograms.items(), key=lambda item: -item[1].totalMs)
+            return [
+                CommandStatsDTO(
+                    collection=collection,
+                    operation=operation,
+                    count=histogram.count,
+                    failures=histogram.failures,
+                    totalMs=histogram.totalMs,
+                    averageMs=histogram.totalMs / histogram.count if histogram.count else 0.0,
+                    maxMs=histogram.maxMs,
+                    documents=histogram.documents,
+                    bytes=histogram.bytes,
+                    histogram={
+                        str(bound): count
+                        for bound, count in zip(HISTOGRAM_BOUNDS_MS + ("inf",), histogram.buckets)  # type: ignore
+                    },
+                    shapes=sorted(
+                        (
+                            QueryShapeStatsDTO(shape, int(count), totalMs, maxMs)
+                            for shape, (count, totalMs, maxMs) in histogram.shapes.items()
+                        ),
+                        key=lambda shapeStats: -shapeStats.totalMs,
+                    ),
+                )
+                for (collection, operation), histogram in histograms
+            ]
+
+    def slowCommands(self) -> list[SlowCommandDTO]:
+        with self._lock:
+            return list(reversed(self._slowCommands))
@@ -0,0 +1,110 @@
+import threading
+import time
+from collections import Counter
+
+from pymongo import monitoring
+
+from domain.DTOs.connectionPoolStatsDTO import ConnectionPoolStatsDTO
+
+
+class ConnectionPoolMonitor(monitoring.ConnectionPoolListener):
+    """
+    Counts pool events so pool sizes can be tuned per worker.
+    pymongo checks connections out synchronously on a worker thread, so the wait for a connection
+    is measured from the checkout-started event to the checked-out (or failed) event on that thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.connectionsOpen = 0
+            self.connectionsCreated = 0
+            self.connectionsClosed = 0
+            self.checkedOut = 0
+            self.waiting = 0
+            self.maxWaiting = 0
+            self.checkouts = 0
+            self.checkoutFailures: Counter[str] = Counter()
+            self.totalWaitSeconds = 0.0
+            self.maxWaitSeconds = 0.0
+            self.poolClears = 0
+
+    def _finishWait(self):
+        startedAt = getattr(self._local, "startedAt", None)
+        self._local.startedAt = None
+        waited = time.perf_counter() - startedAt if startedAt is not None else 0.0
+        self.waiting = max(self.waiting - 1, 0)
+        return waited
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self.poolClears += 1
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        with self._lock:
+            self.connectionsCreated += 1
+            self.connectionsOpen += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        with self._lock:
+            self.connectionsClosed += 1
+            self.connectionsOpen = max(self.connectionsOpen - 1, 0)
+
+    def connection_check_out_started(self, event):
+        self._local.startedAt = time.perf_counter()
+        with self._lock:
+            self.waiting += 1
+            self.maxWaiting = max(self.maxWaiting, self.waiting)
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            self._finishWait()
+            self.checkoutFailures[str(event.reason)] += 1
+
+    def connection_checked_out(self, event):
+        with self._lock:
+            waited = self._finishWait()
+            self.checkouts += 1
+            self.checkedOut += 1
+            self.totalWaitSeconds += waited
+            self.maxWaitSeconds = max(self.maxWaitSeconds, waited)
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            self.checkedOut = max(self.checkedOut - 1, 0)
+
+    def stats(self, maxPoolSize: int, minPoolSize: int) -> ConnectionPoolStatsDTO:
+        with self._lock:
+            return ConnectionPoolStatsDTO(
+                maxPoolSize=maxPoolSize,
+                minPoolSize=minPoolSize,
+                connectionsOpen=self.connectionsOpen,
+                connectionsCreated=self.connectionsCreated,
+                connectionsClosed=self.connectionsClosed,
+                checkedOut=self.checkedOut,
+                waitQueueLength=self.waiting,
+                maxWaitQueueLength=self.maxWaiting,
+                checkouts=self.checkouts,
+                checkoutFailures=dict(self.checkoutFailures),
+                averageWaitMs=(
+                    self.totalWaitSeconds * 1000 / self.checkouts if self.checkouts else 0.0
+                ),
+                maxWaitMs=self.maxWaitSeconds * 1000,
+                poolClears=self.poolClears,
+            )
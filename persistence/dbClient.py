@@ -1,18 +1,80 @@
+import asyncio
+import importlib.util
 import os
+from typing import Any, Optional
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
+from domain.DTOs.commandStatsDTO import CommandStatsDTO, SlowCommandDTO
+from domain.DTOs.connectionPoolStatsDTO import ConnectionPoolStatsDTO
+from persistence.commandMonitor import CommandMonitor
+from persistence.connectionPoolMonitor import ConnectionPoolMonitor
+
+# Wire compressors in order of preference, with the module pymongo needs for each.
+COMPRESSOR_MODULES = {"zstd": "zstandard", "snappy": "snappy", "zlib": "zlib"}
+
+
+def availableCompressors(requested: str) -> list[str]:
+    return [
+        name
+        for name in (part.strip() for part in requested.split(","))
+        if name in COMPRESSOR_MODULES
+        and importlib.util.find_spec(COMPRESSOR_MODULES[name]) is not None
+    ]
+
+
+def _intSetting(name: str, default: Optional[int]) -> Optional[int]:
+    value = os.environ.get(name)
+    return int(value) if value else default
+
 
 class DatabaseClient:
     _instance = None
     _client = None
 
+    poolMonitor = ConnectionPoolMonitor()
+    commandMonitor = CommandMonitor()
+
     @staticmethod
     def getInstance():
+        # Lazily connects for scripts; the app connects and closes explicitly around serving.
         if DatabaseClient._instance is None:
             DatabaseClient._instance = DatabaseClient()
             DatabaseClient._instance._initialize_client()
         return DatabaseClient._instance
 
+    @staticmethod
+    async def connect() -> "DatabaseClient":
+        # Creating the client here binds it to the serving event loop, and the ping fails fast on bad config.
+        instance = DatabaseClient.getInstance()
+        DatabaseClient.commandMonitor.attach(asyncio.get_running_loop(), instance._client)
+        await instance._client.admin.command("ping")
+        return instance
+
+    @staticmethod
+    def close():
+        instance = DatabaseClient._instance
+        DatabaseClient._instance = None
+        if instance is not None and instance._client is not None:
+            instance._client.close()
+
+    @staticmethod
+    def clientOptions() -> dict[str, Any]:
+        options: dict[str, Any] = {
+            "uuidRepresentation": "standard",
+            "maxPoolSize": _intSetting("DB_MAX_POOL_SIZE", 100),
+            "minPoolSize": _intSetting("DB_MIN_POOL_SIZE", 0),
+            "maxIdleTimeMS": _intSetting("DB_MAX_IDLE_TIME_MS", None),
+            "waitQueueTimeoutMS": _intSetting("DB_WAIT_QUEUE_TIMEOUT_MS", None),
+            "connectTimeoutMS": _intSetting("DB_CONNECT_TIMEOUT_MS", 10_000),
+            "serverSelectionTimeoutMS": _intSetting("DB_SERVER_SELECTION_TIMEOUT_MS", 10_000),
+            "socketTimeoutMS": _intSetting("DB_SOCKET_TIMEOUT_MS", None),
+            "event_listeners": [DatabaseClient.poolMonitor, DatabaseClient.commandMonitor],
+        }
+        compressors = availableCompressors(os.environ.get("DB_COMPRESSORS", "zstd,snappy,zlib"))
+        if compressors:
+            options["compressors"] = ",".join(compressors)
+        return {name: value for name, value in options.items() if value is not None}
+
     def _initialize_client(self):
         environment = os.getenv("FLASK_ENV", "development")
         db_host = os.environ.get("DB_HOST", "localhost")
@@ -20,21 +82,34 @@ class DatabaseClient:
         db_user = os.getenv("DB_USER", "admin")
         db_password = os.getenv("DB_PASSWORD", "password")
 
+        self._options = DatabaseClient.clientOptions()
         if environment == "production":
             ssl_cert_path = "global-bundle.pem"
             self._client = AsyncIOMotorClient(
                 f"mongodb://{db_user}:{db_password}@{db_host}:{db_port}/?tls=true&tlsCAFile={ssl_cert_path}&replicaSet=rs0&readPreference=secondaryPreferred&retryWrites=false",
-                uuidRepresentation="standard",
+                **self._options,
             )
         else:
             self._client = AsyncIOMotorClient(
-                f"mongodb://{db_host}:{db_port}/", uuidRepresentation="standard"
+                f"mongodb://{db_host}:{db_port}/", **self._options
             )
         self._db: AsyncIOMotorDatabase = self._client["generic"]
 
     def getDb(self) -> AsyncIOMotorDatabase:
         return self._db
 
+    def poolStats(self) -> ConnectionPoolStatsDTO:
+        options = getattr(self, "_options", None) or DatabaseClient.clientOptions()
+        return DatabaseClient.poolMonitor.stats(
+            options["maxPoolSize"], options["minPoolSize"]
+        )
+
+    def commandStats(self) -> list[CommandStatsDTO]:
+        return DatabaseClient.commandMonitor.stats()
+
+    def slowCommands(self) -> list[SlowCommandDTO]:
+        return DatabaseClient.commandMonitor.slowCommands()
+
 
 def getDb():
     instance = DatabaseClient.getInstance()
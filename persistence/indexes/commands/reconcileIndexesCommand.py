@@ -0,0 +1,51 @@
+from typing import Type, TypeVar
+from domain.abstractEntity.abstractEntity import AbstractEntity
+from domain.abstractEntity.entityIndex import IndexReconciliation
+from persistence.dbClient import getDb
+from domain.option.option import Option
+from domain.utility.errorHandling import serviceErrorHandling
+
+T = TypeVar("T", bound=AbstractEntity)
+
+
+@serviceErrorHandling
+async def ReconcileIndexesCommand(
+    entityType: Type[T], dropUndeclared: bool = False, rebuildChanged: bool = False
+) -> Option[IndexReconciliation]:
+    """
+    Creates declared indexes that are missing, which is idempotent and safe from several workers
+    at once. Rebuilding an index whose options changed, or dropping undeclared ones, isn't: two
+    workers would drop each other's fresh index and leave the collection without it for a while.
+    Those only happen with rebuildChanged/dropUndeclared, which only the one-off tool passes.
+    """
+    collectionName = entityType.getCollectionName()
+    collection = getDb()[collectionName]
+
+    existingIndexes = {index["name"]: index async for index in collection.list_indexes()}
+    declaredIndexes = {index.indexName(): index for index in entityType.getIndexes()}
+
+    created: list[str] = []
+    dropped: list[str] = []
+    outdated: list[str] = []
+
+    for name, index in declaredIndexes.items():
+        existing = existingIndexes.get(name)
+        if existing is not None and index.matches(existing):
+            continue
+        if existing is not None:
+            if not rebuildChanged:
+                outdated.append(name)
+                continue
+            # Options changed, Mongo won't modify an index in place.
+            await collection.drop_index(name)
+            dropped.append(name)
+        await collection.create_index(index.keys, **index.indexOptions())
+        created.append(name)
+
+    if dropUndeclared:
+        for name in existingIndexes:
+            if name != "_id_" and name not in declaredIndexes:
+                await collection.drop_index(name)
+                dropped.append(name)
+
+    return Option(IndexReconciliation(collectionName, created, dropped, outdated))
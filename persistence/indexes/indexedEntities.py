@@ -0,0 +1,10 @@
+from typing import Type
+from domain.abstractEntity.abstractEntity import AbstractEntity
+from domain.imageGenerations.imageGeneration import ImageGeneration
+from domain.users.user import User
+
+# Every persisted entity type whose declared indexes should exist in Mongo.
+INDEXED_ENTITIES: list[Type[AbstractEntity]] = [
+    User,
+    ImageGeneration,
+]
@@ -0,0 +1,31 @@
+from typing import Type, TypeVar
+from domain.abstractEntity.abstractEntity import AbstractEntity
+from domain.abstractEntity.entityIndex import QueryShapeExplanation
+from domain.utility.mongoHelpers import planStages
+from persistence.dbClient import getDb
+from domain.option.option import Option
+from domain.utility.errorHandling import serviceErrorHandling
+
+T = TypeVar("T", bound=AbstractEntity)
+
+
+@serviceErrorHandling
+async def ExplainQueryShapesQuery(entityType: Type[T]) -> Option[list[QueryShapeExplanation]]:
+    collectionName = entityType.getCollectionName()
+    collection = getDb()[collectionName]
+
+    explanations = []
+    for queryShape in entityType.getQueryShapes():
+        cursor = collection.find(queryShape.filter)
+        if queryShape.sort:
+            cursor = cursor.sort(queryShape.sort)
+        explanation = await cursor.explain()
+
+        stages = planStages(explanation.get("queryPlanner", {}).get("winningPlan", {}))
+        explanations.append(
+            QueryShapeExplanation(
+                collectionName, queryShape, stages, "COLLSCAN" in stages
+            )
+        )
+
+    return Option(explanations)
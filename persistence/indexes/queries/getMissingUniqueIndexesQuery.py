@@ -0,0 +1,26 @@
+from typing import Type, TypeVar
+from domain.abstractEntity.abstractEntity import AbstractEntity
+from persistence.dbClient import getDb
+from domain.option.option import Option
+from domain.utility.errorHandling import serviceErrorHandling
+
+T = TypeVar("T", bound=AbstractEntity)
+
+
+@serviceErrorHandling
+async def GetMissingUniqueIndexesQuery(entityType: Type[T]) -> Option[list[str]]:
+    # Declared unique indexes that don't exist as declared, e.g. because building one failed on
+    # duplicate data or reconciling was turned off.
+    collection = getDb()[entityType.getCollectionName()]
+    existingIndexes = {index["name"]: index async for index in collection.list_indexes()}
+    return Option(
+        [
+            index.indexName()
+            for index in entityType.getIndexes()
+            if index.unique
+            and (
+                index.indexName() not in existingIndexes
+                or not index.matches(existingIndexes[index.indexName()])
+            )
+        ]
+    )
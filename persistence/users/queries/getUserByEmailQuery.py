@@ -16,6 +16,6 @@ async def GetUserByEmailQuery(email: str) -> Option[User]:
     if document is None:
         return Option.Error(DomainError("GetUserByEmailQuery-E02", "Could not find user with that email."))
     
-    user = User.fromDict(document)
+    user = User.fromDocument(document)
     
     return Option(user)
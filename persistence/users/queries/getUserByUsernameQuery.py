@@ -21,7 +21,7 @@ class GetUserByUsernameQuery:
         cursor = self.collection.find(query)
         users = []
         async for document in cursor:
-            serialized_object = User.fromDict(document)
+            serialized_object = User.fromDocument(document)
             users.append(serialized_object)
 
         if len(users) < 1:
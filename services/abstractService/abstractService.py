@@ -1,12 +1,27 @@
-from typing import Generic, Type, TypeVar
+from datetime import datetime
+from typing import Any, AsyncGenerator, Generic, Optional, Type, TypeVar
 from uuid import UUID
+from domain.DTOs.bulkItemResultDTO import BulkItemResultDTO
+from domain.DTOs.entityVersionDTO import EntityVersionDTO
+from domain.DTOs.idsDTO import ByIdsResultDTO
 from domain.abstractEntity.abstractEntity import AbstractEntity
+from domain.abstractEntity.projection import Projection
+from domain.caching.entityCache import CacheStats, EntityCache
 from domain.domainError.domainError import DomainError
 from domain.utility.errorHandling import serviceErrorHandling
+from persistence.abstractEntity.commands.bulkInsertCommand import BulkInsertCommand
+from persistence.abstractEntity.commands.bulkUpsertCommand import BulkUpsertCommand
 from persistence.abstractEntity.commands.deleteCommand import DeleteCommand
 from persistence.abstractEntity.commands.upsertByIdCommand import UpsertByIdCommand
+from persistence.abstractEntity.entityLoader import EntityLoader
+from persistence.abstractEntity.queries.getAllGeneratorQuery import GetAllGeneratorQuery
 from persistence.abstractEntity.queries.getAllQuery import GetAllQuery
 from persistence.abstractEntity.queries.getByIdsQuery import GetByIdsQuery
+from persistence.abstractEntity.queries.getByTimespanQuery import GetByTimespanQuery
+from persistence.abstractEntity.queries.getCollectionVersionQuery import GetCollectionVersionQuery
+from persistence.abstractEntity.queries.getVersionByIdQuery import GetVersionByIdQuery
+from persistence.abstractEntity.queries.getPageQuery import GetPageQuery
+from domain.pagination.page import Page, PageRequest
 from domain.option.option import Option
 
 T = TypeVar("T", bound=AbstractEntity)
@@ -28,16 +43,102 @@ class AbstractService(Generic[T]):
     def className(cls) -> str:
         return cls._entityType().__name__
 
+    @classmethod
+    def _entityCache(cls) -> Optional[EntityCache]:
+        # Override to enable the read-through cache for this entity type
+        return None
+
+    @classmethod
+    def cacheStats(cls) -> Optional[CacheStats]:
+        cache = cls._entityCache()
+        return cache.stats() if cache is not None else None
+
+    @classmethod
+    async def _fetchByIds(cls, ids: list[UUID]) -> Option[list[T]]:
+        cache = cls._entityCache()
+        if cache is None:
+            return await GetByIdsQuery(cls._entityType(), ids)
+
+        cachedDocuments = await cache.getMany(ids)
+        entities = [cls._entityType().fromDocument(d) for d in cachedDocuments.values()]
+
+        missingIds = [id for id in ids if id not in cachedDocuments]
+        if missingIds:
+            result = await GetByIdsQuery(cls._entityType(), missingIds)
+            fetched = result.valueOrThrow()
+            await cache.setMany({entity.id: entity.toDict() for entity in fetched})
+            entities.extend(fetched)
+
+        return Option(entities)
+
+    @classmethod
+    def _loader(cls) -> Optional[EntityLoader[T]]:
+        # Request-scoped batcher and identity map, None outside of a request.
+        return EntityLoader.forType(cls._entityType(), cls._fetchByIds)
+
+    @classmethod
+    async def _remember(cls, entities: list[T]):
+        # Keeps the identity map and cache in step with what was just written.
+        # Partial entities can't stand in for the full document, so those are dropped instead.
+        for entity in entities:
+            if entity.isPartial():
+                await cls._forget(entity.id)
+        entities = [entity for entity in entities if not entity.isPartial()]
+        if (loader := cls._loader()) is not None:
+            for entity in entities:
+                loader.prime(entity.id, entity)
+        if (cache := cls._entityCache()) is not None and entities:
+            await cache.setMany({entity.id: entity.toDict() for entity in entities})
+
+    @classmethod
+    async def _forget(cls, id: UUID):
+        if (loader := cls._loader()) is not None:
+            loader.clear(id)
+        if (cache := cls._entityCache()) is not None:
+            await cache.delete(id)
+
+    @classmethod
+    @serviceErrorHandling
+    async def getByIds(
+        cls, ids: list[UUID], projection: Optional[Projection] = None
+    ) -> Option[list[T]]:
+        # Projected reads go straight to Mongo, the identity map and cache only hold full entities.
+        if projection is not None:
+            return await GetByIdsQuery(cls._entityType(), ids, projection)
+        loader = cls._loader()
+        if loader is None:
+            return await cls._fetchByIds(ids)
+        entities = await loader.loadMany(list(dict.fromkeys(ids)))
+        return Option([entity for entity in entities if entity is not None])
+
     @classmethod
     @serviceErrorHandling
-    async def getByIds(cls, ids: list[UUID]) -> Option[list[T]]:
-        return await GetByIdsQuery(cls._entityType(), ids)
+    async def getByIdsInOrder(
+        cls, ids: list[UUID], projection: Optional[Projection] = None
+    ) -> Option[ByIdsResultDTO[T]]:
+        # One $in for all of them (less what the cache has), answered in the order asked for.
+        entities = (await cls.getByIds(list(dict.fromkeys(ids)), projection)).valueOrThrow()
+        entitiesById = {entity.id: entity for entity in entities}
+        return Option(
+            ByIdsResultDTO(
+                [entitiesById.get(id) for id in ids],
+                [id for id in dict.fromkeys(ids) if id not in entitiesById],
+            )
+        )
 
     @classmethod
     @serviceErrorHandling
-    async def getById(cls, id: UUID) -> Option[T]:
-        result = await GetByIdsQuery(cls._entityType(), [id])
-        objects = result.valueOrThrow()
+    async def getById(cls, id: UUID, projection: Optional[Projection] = None) -> Option[T]:
+        loader = cls._loader()
+        if projection is not None:
+            result = await GetByIdsQuery(cls._entityType(), [id], projection)
+            objects = result.valueOrThrow()
+        elif loader is None:
+            result = await cls._fetchByIds([id])
+            objects = result.valueOrThrow()
+        else:
+            entity = await loader.load(id)
+            objects = [entity] if entity is not None else []
         if len(objects) == 0:
             return Option.Error(
                 DomainError(
@@ -49,17 +150,99 @@ class AbstractService(Generic[T]):
 
     @classmethod
     @serviceErrorHandling
-    async def getAll(cls) -> Option[list[T]]:
-        return await GetAllQuery(cls._entityType())
+    async def getVersion(cls, id: UUID) -> Option[EntityVersionDTO]:
+        # Answers conditional GETs without loading the entity, from the cache when it has it.
+        if (cache := cls._entityCache()) is not None:
+            document = (await cache.getMany([id])).get(id)
+            if document is not None:
+                return Option(EntityVersionDTO.forEntity(id, document.get("updatedDate")))
+        return await GetVersionByIdQuery(cls._entityType(), id)
+
+    @classmethod
+    @serviceErrorHandling
+    async def getCollectionVersion(cls) -> Option[EntityVersionDTO]:
+        return await GetCollectionVersionQuery(cls._entityType())
+
+    @classmethod
+    @serviceErrorHandling
+    async def getAll(cls, projection: Optional[Projection] = None) -> Option[list[T]]:
+        return await GetAllQuery(cls._entityType(), projection)
+
+    @classmethod
+    @serviceErrorHandling
+    async def getAllGenerator(
+        cls, batchSize: int = 500, projection: Optional[Projection] = None
+    ) -> Option[AsyncGenerator[T, None]]:
+        # Yields entities straight off the cursor, for responses that stream instead of building a list.
+        return await GetAllGeneratorQuery(cls._entityType(), batchSize, projection)
+
+    @classmethod
+    @serviceErrorHandling
+    async def getByTimespan(
+        cls,
+        startDate: datetime,
+        endDate: datetime,
+        projection: Optional[Projection] = None,
+        rawBatches: bool = False,
+    ) -> Option[list[T]]:
+        # rawBatches suits large scans, batches are decoded whole instead of document by document.
+        return await GetByTimespanQuery(
+            cls._entityType(), startDate, endDate, projection, rawBatches
+        )
+
+    @classmethod
+    @serviceErrorHandling
+    async def getPage(
+        cls,
+        page: PageRequest,
+        query: Optional[dict[str, Any]] = None,
+        projection: Optional[Projection] = None,
+    ) -> Option[Page[T]]:
+        return await GetPageQuery(cls._entityType(), page, query, projection)
 
     @classmethod
     @serviceErrorHandling
     async def upsert(cls, entity: T) -> Option[T]:
-        return await UpsertByIdCommand(entity)
+        result = await UpsertByIdCommand(entity)
+        if result.value is not None:
+            await cls._remember([result.value])
+        else:
+            # The identity map may hand out this very object, with changes that weren't saved.
+            await cls._forget(entity.id)
+        return result
+
+    @classmethod
+    @serviceErrorHandling
+    async def upsertMany(cls, entities: list[T]) -> Option[list[BulkItemResultDTO]]:
+        result = await BulkUpsertCommand(entities)
+        await cls._rememberBulk(entities, result)
+        return result
+
+    @classmethod
+    @serviceErrorHandling
+    async def insertMany(cls, entities: list[T]) -> Option[list[BulkItemResultDTO]]:
+        result = await BulkInsertCommand(entities)
+        await cls._rememberBulk(entities, result)
+        return result
+
+    @classmethod
+    async def _rememberBulk(
+        cls, entities: list[T], result: Option[list[BulkItemResultDTO]]
+    ):
+        saved = {
+            itemResult.index for itemResult in result.valueOrDefault([]) if itemResult.success
+        }
+        await cls._remember([entities[index] for index in sorted(saved)])
+        # Same as upsert, entities that failed to save mustn't be served from the identity map.
+        for index, entity in enumerate(entities):
+            if index not in saved:
+                await cls._forget(entity.id)
 
     @classmethod
     @serviceErrorHandling
     async def deleteById(cls, id: UUID) -> Option[bool]:
         entityOptional = await cls.getById(id)
         entity = entityOptional.valueOrThrow()
-        return await DeleteCommand(entity)
+        result = await DeleteCommand(entity)
+        await cls._forget(id)
+        return result
@@ -1,7 +1,8 @@
+from domain.DTOs.passwordHashingStatsDTO import PasswordHashingStatsDTO
 from domain.domainError.domainError import DomainError
 from domain.option.option import Option
 from domain.users.user import User
-from domain.utility.auth import checkPassword
+from domain.utility.auth import checkPasswordAsync, passwordHashingPool
 from domain.utility.errorHandling import serviceErrorHandling
 from services.users.userService import UserService
 
@@ -12,7 +13,7 @@ class AuthService:
     async def authenticate(cls, username: str, password: str) -> Option[User]:
         userOption = await UserService.getUserByUsername(username)
         user = userOption.valueOrThrow()
-        passwordCheck = checkPassword(password + user.salt, user.password)
+        passwordCheck = await checkPasswordAsync(password + user.salt, user.password)
         if passwordCheck:
             return Option(user)
         else:
@@ -21,3 +22,8 @@ class AuthService:
                     "AuthService-Authenticate-E02", "Invalid credentials", status=401
                 )
             )
+
+    @classmethod
+    @serviceErrorHandling
+    async def hashingStats(cls) -> Option[PasswordHashingStatsDTO]:
+        return Option(passwordHashingPool.stats())
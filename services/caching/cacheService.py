@@ -0,0 +1,26 @@
+from typing import Type
+from domain.DTOs.entityCacheStatsDTO import EntityCacheStatsDTO
+from domain.option.option import Option
+from domain.utility.errorHandling import serviceErrorHandling
+from services.abstractService.abstractService import AbstractService
+from services.imageGenerations.imageGenerationService import ImageGenerationService
+from services.users.userService import UserService
+
+# Every entity service, the ones without a cache are skipped.
+ENTITY_SERVICES: list[Type[AbstractService]] = [
+    UserService,
+    ImageGenerationService,
+]
+
+
+class CacheService:
+    @classmethod
+    @serviceErrorHandling
+    async def stats(cls) -> Option[list[EntityCacheStatsDTO]]:
+        return Option(
+            [
+                EntityCacheStatsDTO(service.className(), stats)
+                for service in ENTITY_SERVICES
+                if (stats := service.cacheStats()) is not None
+            ]
+        )
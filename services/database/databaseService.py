@@ -0,0 +1,22 @@
+from domain.DTOs.commandStatsDTO import CommandStatsDTO, SlowCommandDTO
+from domain.DTOs.connectionPoolStatsDTO import ConnectionPoolStatsDTO
+from domain.option.option import Option
+from domain.utility.errorHandling import serviceErrorHandling
+from persistence.dbClient import DatabaseClient
+
+
+class DatabaseService:
+    @classmethod
+    @serviceErrorHandling
+    async def poolStats(cls) -> Option[ConnectionPoolStatsDTO]:
+        return Option(DatabaseClient.getInstance().poolStats())
+
+    @classmethod
+    @serviceErrorHandling
+    async def commandStats(cls) -> Option[list[CommandStatsDTO]]:
+        return Option(DatabaseClient.getInstance().commandStats())
+
+    @classmethod
+    @serviceErrorHandling
+    async def slowCommands(cls) -> Option[list[SlowCommandDTO]]:
+        return Option(DatabaseClient.getInstance().slowCommands())
@@ -1,9 +1,11 @@
-import asyncio
-from typing import Literal, Type
+from contextlib import aclosing
+from typing import AsyncGenerator, Literal, Type
 from domain.aIClients.aiClient import AIClient
+from domain.logging.logger import Logger
 from domain.option.option import Option
 from domain.utility.errorHandling import serviceErrorHandling
 from services.abstractService.abstractService import AbstractService
+from services.users.userService import UserService
 
 from domain.imageGenerations.imageGeneration import ImageGeneration
 
@@ -16,13 +18,24 @@ class ImageGenerationService(AbstractService[ImageGeneration]):
     
     @classmethod
     @serviceErrorHandling
-    async def generateImages(cls, prompt: str, ratio: str, n: int = 3) -> Option[list[ImageGeneration]]:
+    async def generateImages(
+        cls, prompt: str, ratio: str, n: int = 3
+    ) -> Option[AsyncGenerator[ImageGeneration, None]]:
+        (await UserService.materializeGuest()).valueOrThrow()
         aiClient = AIClient()
-        imagesOptional = await aiClient.generateImages(prompt, ratio, n) # type: ignore
-        imageUrls = imagesOptional.valueOrThrow()
+        imageUrlsOptional = await aiClient.streamImages(prompt, ratio, n) # type: ignore
+        imageUrls = imageUrlsOptional.valueOrThrow()
 
-        imageGenerations = [ImageGeneration(prompt, imageUrl) for imageUrl in imageUrls]
+        async def generator() -> AsyncGenerator[ImageGeneration, None]:
+            # Each image is saved and handed on as soon as it's ready, instead of waiting for the
+            # slowest one. Closing this early closes the client's stream, cancelling the rest.
+            async with aclosing(imageUrls):
+                async for imageUrl in imageUrls:
+                    imageGeneration = ImageGeneration(prompt, imageUrl)
+                    result = await cls.upsert(imageGeneration)
+                    if result.error is not None:
+                        Logger.error(result.error)
+                        continue
+                    yield imageGeneration
 
-        await asyncio.gather(*[cls.upsert(ig) for ig in imageGenerations])
-
-        return Option(imageGenerations)
+        return Option(generator())
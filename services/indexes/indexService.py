@@ -0,0 +1,64 @@
+from domain.abstractEntity.entityIndex import IndexReconciliation, QueryShapeExplanation
+from domain.domainError.domainError import DomainError
+from domain.logging.logger import Logger
+from domain.option.option import Option
+from domain.utility.errorHandling import serviceErrorHandling
+from persistence.indexes.commands.reconcileIndexesCommand import ReconcileIndexesCommand
+from persistence.indexes.indexedEntities import INDEXED_ENTITIES
+from persistence.indexes.queries.explainQueryShapesQuery import ExplainQueryShapesQuery
+from persistence.indexes.queries.getMissingUniqueIndexesQuery import GetMissingUniqueIndexesQuery
+
+
+class IndexService:
+    @classmethod
+    @serviceErrorHandling
+    async def reconcileAll(
+        cls, dropUndeclared: bool = False, rebuildChanged: bool = False
+    ) -> Option[list[IndexReconciliation]]:
+        reconciliations = []
+        for entityType in INDEXED_ENTITIES:
+            result = await ReconcileIndexesCommand(entityType, dropUndeclared, rebuildChanged)
+            reconciliation = result.valueOrThrow()
+            if reconciliation.created or reconciliation.dropped:
+                Logger.info(
+                    f"Reconciled indexes on {reconciliation.collectionName}: created {reconciliation.created}, dropped {reconciliation.dropped}",
+                    reconciliation.toDict(),
+                )
+            if reconciliation.outdated:
+                Logger.warning(
+                    "IndexService-ReconcileAll-W01",
+                    f"Indexes on {reconciliation.collectionName} have changed options, run tools/reconcileIndexes.py: {reconciliation.outdated}",
+                    reconciliation.toDict(),
+                )
+            reconciliations.append(reconciliation)
+        return Option(reconciliations)
+
+    @classmethod
+    @serviceErrorHandling
+    async def ensureUniqueIndexes(cls) -> Option[bool]:
+        # Writes like UserService.verifyUser rely on unique indexes instead of looking for
+        # duplicates first, so serving without them would silently accept duplicates.
+        missing = []
+        for entityType in INDEXED_ENTITIES:
+            result = await GetMissingUniqueIndexesQuery(entityType)
+            missing.extend(
+                f"{entityType.getCollectionName()}.{name}" for name in result.valueOrThrow()
+            )
+        if missing:
+            return Option.Error(
+                DomainError(
+                    "IndexService-EnsureUniqueIndexes-E01",
+                    f"Unique indexes missing or outdated, run tools/reconcileIndexes.py: {', '.join(missing)}",
+                    status=500,
+                )
+            )
+        return Option(True)
+
+    @classmethod
+    @serviceErrorHandling
+    async def explainAll(cls) -> Option[list[QueryShapeExplanation]]:
+        explanations = []
+        for entityType in INDEXED_ENTITIES:
+            result = await ExplainQueryShapesQuery(entityType)
+            explanations.extend(result.valueOrThrow())
+        return Option(explanations)
@@ -2,30 +2,53 @@ import asyncio
 from datetime import datetime, timedelta
 import random
 import re
-from typing import Type
+from typing import Optional, Type
 from uuid import UUID
 
 import httpx
 from domain.aIClients.aiClient import AIClient
+from domain.caching.entityCache import EntityCache, InMemoryEntityCache
 from domain.domainError.domainError import DomainError
 from domain.emailClients.emailClient import EmailClient
 from domain.option.option import Option
 from domain.users.user import User
-from domain.utility.auth import checkPassword, hashPassword
+from domain.utility.auth import hashPasswordAsync
 from domain.utility.errorHandling import serviceErrorHandling
-from persistence.abstractEntity.commands.upsertByIdCommand import UpsertByIdCommand
+from domain.utility.userProvider import UserIdentity, UserProvider
+from domain.utility.verificationCode import (
+    MAX_VERIFICATION_ATTEMPTS,
+    VERIFICATION_CODE_TTL,
+    checkVerificationCode,
+    newVerificationCode,
+    verificationDigest,
+)
+from persistence.abstractEntity.commands.findOneAndUpdateCommand import (
+    DUPLICATE_KEY_ERROR,
+    NOT_MATCHED_ERROR,
+    FindOneAndUpdateCommand,
+    duplicateKeyFields,
+)
+from persistence.abstractEntity.commands.insertIfMissingCommand import InsertIfMissingCommand
 from persistence.abstractEntity.queries.getByIdQuery import GetByIdQuery
 from persistence.abstractEntity.queries.getByUserIdsQuery import GetByUserIdsQuery
-from persistence.users.queries.getUserByEmailQuery import GetUserByEmailQuery
 from persistence.users.queries.getUserByUsernameQuery import GetUserByUsernameQuery
 from services.abstractService.abstractService import AbstractService
 
 
+userCache = InMemoryEntityCache(maxSize=10_000, ttlSeconds=30.0)
+
+GUEST_USERNAME_ATTEMPTS = 3
+
+
 class UserService(AbstractService[User]):
     @classmethod
     def _entityType(cls) -> Type[User]:
         return User
 
+    @classmethod
+    def _entityCache(cls) -> Optional[EntityCache]:
+        return userCache
+
     @classmethod
     @serviceErrorHandling
     async def getUserByUsername(cls, username: str) -> Option[User]:
@@ -48,52 +71,86 @@ class UserService(AbstractService[User]):
 
     @classmethod
     @serviceErrorHandling
-    async def createUser(cls) -> Option[User]:
-        user = User()
-        result = await cls.upsert(user)
-        user = result.valueOrThrow()
+    async def createGuest(cls) -> Option[User]:
+        # Nothing is written, the guest lives in its token until materializeGuest.
+        return Option(User())
+
+    @classmethod
+    def guestIdentity(cls, user: User) -> UserIdentity:
+        return UserIdentity(user.id, user.roles, True, user.username, user.createdDate)
+
+    @classmethod
+    def guestUser(cls, identity: UserIdentity) -> User:
+        # The same guest every time for the same token.
+        user = User(identity.id)
+        user.username = identity.username or user.username
+        user.createdDate = user.updatedDate = identity.createdDate or user.createdDate
+        return user
 
+    @classmethod
+    @serviceErrorHandling
+    async def materializeGuest(cls) -> Option[bool]:
+        # Called before anything a guest does that writes. Writes the guest's User document the
+        # first time and is a no-op after that, or when the caller isn't a guest.
+        if not UserProvider.isGuest():
+            return Option(False)
+        identity = UserProvider.identity()
+        if (cache := cls._entityCache()) is not None and (await cache.getMany([identity.id])):
+            return Option(False)
+        user = cls.guestUser(identity)
+        for _ in range(GUEST_USERNAME_ATTEMPTS):
+            result = await InsertIfMissingCommand(user)
+            if result.error is None or "username" not in duplicateKeyFields(result.error):
+                break
+            # Someone took the placeholder name first, any other one will do for a guest.
+            user.username = f"user_{random.randint(100_000_000, 999_999_999)}"
+        if result.valueOrThrow():
+            await cls._remember([user])
         return result
 
     @classmethod
     @serviceErrorHandling
     async def verifyUser(cls, userId: UUID, email: str, username: str, password: str) -> Option[User]:
-        userOptional = await cls.getUserByUsername(username)
-        if userOptional.isSome():
-            return Option.Error(
-                DomainError("UserService-VerifyUser-E02", "Username taken")
-            )
+        cls.ensurePasswordStrength(password).valueOrThrow()
 
-        userOptional = await GetUserByEmailQuery(email)
-        if userOptional.isSome():
+        if not cls.validateEmail(email):
             return Option.Error(
-                DomainError(
-                    "UserService-VerifyUser-E05", "Email already in use, please sign in"
-                )
+                DomainError("UserService-VerifyUser-E04", "Invalid email")
             )
-
-        userOptional = await cls.getById(userId)
-        user = userOptional.valueOrThrow()
-
-        if user.isVerified or not user.isGuest:
+        (await cls.materializeGuest()).valueOrThrow()
+
+        # The unique username/email indexes replace the lookups, and the isGuest filter the read.
+        salt = str(random.randint(100_000_000, 999_999_999))
+        result = await FindOneAndUpdateCommand(
+            User,
+            {"_id": userId, "isGuest": True, "isVerified": False},
+            {
+                "$set": {
+                    "email": email,
+                    "username": username,
+                    "salt": salt,
+                    "password": await hashPasswordAsync(password + salt),
+                    "isGuest": False,
+                }
+            },
+        )
+        if result.error is not None and result.error.errorCode == DUPLICATE_KEY_ERROR:
+            if "email" in duplicateKeyFields(result.error):
+                return Option.Error(
+                    DomainError(
+                        "UserService-VerifyUser-E05", "Email already in use, please sign in"
+                    )
+                )
             return Option.Error(
-                DomainError("UserService-VerifyUser-E03", "User already signed up.")
+                DomainError("UserService-VerifyUser-E02", "Username taken")
             )
-
-        cls.ensurePasswordStrength(password).valueOrThrow()
-
-        if not cls.validateEmail(email):
+        if result.error is not None and result.error.errorCode == NOT_MATCHED_ERROR:
+            (await cls.getById(userId)).valueOrThrow()
             return Option.Error(
-                DomainError("UserService-VerifyUser-E04", "Invalid email")
+                DomainError("UserService-VerifyUser-E03", "User already signed up.")
             )
-
-        user.email = email
-        user.username = username
-        user.password = hashPassword(password + user.salt)
-        user.isGuest = False
-
-        userOptional = await cls.upsert(user)
-        user = userOptional.valueOrThrow()
+        user = result.valueOrThrow()
+        await cls._remember([user])
 
         # Now, verify the email
         result = await cls.sendVerificationCode(user.id)
@@ -104,28 +161,39 @@ class UserService(AbstractService[User]):
     @classmethod
     @serviceErrorHandling
     async def sendVerificationCode(cls, userId: UUID) -> Option[bool]:
-        userOptional = await GetByIdQuery(User, userId)
-        user = userOptional.valueOrThrow()
-
-        if not cls.validateEmail(user.email):
-            return Option.Error(
-                DomainError("UserService-SendVerificationCode-E04", "Invalid email")
-            )
-
-        if user.isVerified:
-            return Option.Error(DomainError("UserService-SendVerificationCode-E02", "User is already verified."))
-
-        if user.verificationSendTime is not None and user.verificationSendTime - datetime.utcnow() < timedelta(minutes=1):
+        rawCode = newVerificationCode()
+        now = datetime.utcnow()
+
+        result = await FindOneAndUpdateCommand(
+            User,
+            {
+                "_id": userId,
+                "isVerified": False,
+                "email": {"$gt": ""},
+                "$or": [
+                    {"verificationSendTime": None},
+                    {"verificationSendTime": {"$lte": now - timedelta(minutes=1)}},
+                ],
+            },
+            {
+                "$set": {
+                    "verificationHash": verificationDigest(userId, rawCode),
+                    "verificationSendTime": now,
+                    "verificationAttempts": 0,
+                }
+            },
+        )
+        if result.error is not None and result.error.errorCode == NOT_MATCHED_ERROR:
+            user = (await cls.getById(userId)).valueOrThrow()
+            if user.isVerified:
+                return Option.Error(DomainError("UserService-SendVerificationCode-E02", "User is already verified."))
+            if not cls.validateEmail(user.email):
+                return Option.Error(
+                    DomainError("UserService-SendVerificationCode-E04", "Invalid email")
+                )
             return Option.Error(DomainError("UserService-SendVerificationCode-E03", "Already sent a code in the last minute."))
-
-        rawCode = f"{str(random.randint(int(1e8), int(1e9-1)))}"
-        hashedCode = hashPassword(rawCode + user.salt)
-
-        user.verificationHash = hashedCode
-        user.verificationSendTime = datetime.utcnow()
-
-        userOptional = await UpsertByIdCommand(user)
-        user = userOptional.valueOrThrow()
+        user = result.valueOrThrow()
+        await cls._remember([user])
 
         emailResult = await EmailClient().sendEmail(
             subject=f"Generic Verification Code - {rawCode}",
@@ -148,36 +216,82 @@ class UserService(AbstractService[User]):
     @classmethod
     @serviceErrorHandling
     async def verifyEmail(cls, userId: UUID, verificationCode: str) -> Option[User]:
-        userOptional = await GetByIdQuery(User, userId)
-        user = userOptional.valueOrThrow()
-
-        if user.verificationSendTime is not None and user.verificationSendTime - datetime.utcnow() > timedelta(days=1):
-            return Option.Error(DomainError("UserService-VerifyEmail-E03", "Code has expired."))
+        # Every check spends an attempt, whether the code turns out right or not, and only codes
+        # that are still live and have attempts left can be checked.
+        now = datetime.utcnow()
+        result = await FindOneAndUpdateCommand(
+            User,
+            {
+                "_id": userId,
+                "isVerified": False,
+                "verificationHash": {"$type": "string"},
+                "verificationSendTime": {"$gt": now - VERIFICATION_CODE_TTL},
+                # $not also matches users whose code was sent before attempts were counted.
+                "verificationAttempts": {"$not": {"$gte": MAX_VERIFICATION_ATTEMPTS}},
+            },
+            {"$inc": {"verificationAttempts": 1}},
+        )
+        if result.error is not None and result.error.errorCode == NOT_MATCHED_ERROR:
+            return await cls._verifyEmailError(userId, now)
+        user = result.valueOrThrow()
 
-        if not checkPassword(verificationCode + user.salt, user.verificationHash):
+        if not checkVerificationCode(userId, verificationCode, user.verificationHash):
+            await cls._remember([user])
             return Option.Error(
                 DomainError("UserService-VerifyEmail-E04", "Invalid code.")
             )
 
-        user.isVerified = True
-        result = await UpsertByIdCommand(user)
+        # Only applies if no new code was sent since the check.
+        result = await FindOneAndUpdateCommand(
+            User,
+            {"_id": userId, "verificationHash": user.verificationHash},
+            {"$set": {"isVerified": True, "verificationHash": None}},
+        )
+        if result.error is not None and result.error.errorCode == NOT_MATCHED_ERROR:
+            return Option.Error(
+                DomainError("UserService-VerifyEmail-E04", "Invalid code.")
+            )
         user = result.valueOrThrow()
+        await cls._remember([user])
 
         return Option(user)
 
+    @classmethod
+    async def _verifyEmailError(cls, userId: UUID, now: datetime) -> Option[User]:
+        # Off the happy path, so reading the user again to say why is fine.
+        user = (await GetByIdQuery(User, userId)).valueOrThrow()
+        if user.isVerified:
+            return Option.Error(DomainError("UserService-VerifyEmail-E02", "User is already verified."))
+        if not user.verificationHash or user.verificationSendTime is None:
+            return Option.Error(
+                DomainError("UserService-VerifyEmail-E04", "Invalid code.")
+            )
+        if now - user.verificationSendTime > VERIFICATION_CODE_TTL:
+            return Option.Error(DomainError("UserService-VerifyEmail-E03", "Code has expired."))
+        return Option.Error(
+            DomainError(
+                "UserService-VerifyEmail-E05", "Too many attempts, please request a new code.", status=429
+            )
+        )
+
     @classmethod
     @serviceErrorHandling
     async def addRole(cls, userId: UUID, role: str) -> Option[User]:
-        userOptional = await cls.getById(userId)
-        user = userOptional.valueOrThrow()
-        if role in user.roles:
+        result = await FindOneAndUpdateCommand(
+            User,
+            {"_id": userId, "roles": {"$ne": role}},
+            {"$addToSet": {"roles": role}},
+        )
+        if result.error is not None and result.error.errorCode == NOT_MATCHED_ERROR:
+            (await cls.getById(userId)).valueOrThrow()
             return Option.Error(
                 DomainError(
                     "UserService-AddRole-E02", "User already has role.", status=400
                 )
             )
-        user.roles.append(role)
-        return await cls.upsert(user)
+        user = result.valueOrThrow()
+        await cls._remember([user])
+        return Option(user)
 
     @staticmethod
     async def isValidImage(imageUrl: str) -> bool:
@@ -191,9 +305,10 @@ class UserService(AbstractService[User]):
     @classmethod
     @serviceErrorHandling
     async def setProfileImage(cls, userId: UUID, imageUrl: str) -> Option[User]:
-        userOptional = await cls.getById(userId)
-        user = userOptional.valueOrThrow()
-
-        user.profileImageUrl = imageUrl
-
-        return await cls.upsert(user)
\ No newline at end of file
+        (await cls.materializeGuest()).valueOrThrow()
+        result = await FindOneAndUpdateCommand(
+            User, {"_id": userId}, {"$set": {"profileImageUrl": imageUrl}}
+        )
+        user = result.valueOrThrow()
+        await cls._remember([user])
+        return Option(user)
\ No newline at end of file
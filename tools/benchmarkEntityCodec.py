@@ -0,0 +1,162 @@
+# Benchmarks BaseEntity.fromDict / toDict against the previous reflection-based implementation.
+# Run from the project root: python tools/benchmarkEntityCodec.py [rows]
+
+import os
+import sys
+import time
+from dataclasses import fields, is_dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Union, get_args, get_origin
+from uuid import UUID, uuid4
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from domain.imageGenerations.imageGeneration import ImageGeneration
+from domain.users.user import User
+
+
+def legacyHandleValue(fieldValue, safedate):
+    if isinstance(fieldValue, Enum):
+        fieldValue = fieldValue.value
+    if isinstance(fieldValue, type):
+        return str(fieldValue)
+    elif is_dataclass(fieldValue):
+        return legacyToDict(fieldValue, safedate)
+    elif isinstance(fieldValue, datetime):
+        return fieldValue.isoformat() if safedate else fieldValue
+    elif isinstance(fieldValue, list):
+        return [
+            legacyToDict(item, safedate) if is_dataclass(item) else item
+            for item in fieldValue
+        ]
+    else:
+        return fieldValue
+
+
+def legacyToDict(entity, safedate=False):
+    result = {}
+    for field in fields(entity):
+        if not hasattr(entity, field.name):
+            continue
+        result[field.name] = legacyHandleValue(getattr(entity, field.name), safedate)
+    for attrName in dir(entity):
+        if attrName.startswith("_") or attrName in result:
+            continue
+        attrValue = getattr(entity, attrName)
+        if callable(attrValue):
+            continue
+        result[attrName] = legacyHandleValue(attrValue, safedate)
+    return result
+
+
+def legacyFromDict(cls, d):
+    fieldTypes = {f.name: f.type for f in fields(cls)}
+    kwargs = {}
+    for f, expectedType in fieldTypes.items():
+        if f in d and d[f] is not None:
+            originType = get_origin(expectedType)
+            argTypes = get_args(expectedType)
+            if originType == Union and type(None) in argTypes:
+                expectedType = next(t for t in argTypes if t is not type(None))
+            if expectedType == UUID:
+                try:
+                    kwargs[f] = UUID(str(d[f]))
+                except:
+                    kwargs[f] = d[f]
+            elif expectedType == datetime and isinstance(d[f], str):
+                kwargs[f] = datetime.fromisoformat(d[f])
+            elif get_origin(expectedType) == list:
+                elemType = get_args(expectedType)[0]
+                if elemType == UUID:
+                    kwargs[f] = [UUID(str(x)) for x in d[f]]
+                elif is_dataclass(elemType):
+                    kwargs[f] = [legacyFromDict(elemType, x) for x in d[f]]
+                else:
+                    kwargs[f] = d[f]
+            elif is_dataclass(expectedType):
+                kwargs[f] = legacyFromDict(expectedType, d[f])
+            elif isinstance(expectedType, type) and issubclass(expectedType, Enum):
+                kwargs[f] = expectedType(d[f])
+            else:
+                kwargs[f] = d[f]
+        else:
+            kwargs[f] = None
+    instance = cls.__new__(cls)
+    for key, value in kwargs.items():
+        setattr(instance, key, value)
+    return instance
+
+
+def userDocument(i: int) -> dict:
+    now = datetime.utcnow()
+    return {
+        "_id": uuid4(),
+        "id": uuid4(),
+        "createdDate": now,
+        "createdBy": uuid4(),
+        "updatedDate": now,
+        "updatedBy": uuid4(),
+        "email": f"user{i}@generic.com",
+        "username": f"user_{i}",
+        "password": "$2b$12$" + "x" * 53,
+        "roles": ["Admin"] if i % 10 == 0 else [],
+        "profileImageUrl": None,
+        "salt": str(100_000_000 + i),
+        "verificationHash": "$2b$12$" + "y" * 53,
+        "verificationSendTime": now,
+        "isGuest": False,
+        "isVerified": True,
+    }
+
+
+def imageGenerationDocument(i: int) -> dict:
+    now = datetime.utcnow()
+    return {
+        "_id": uuid4(),
+        "id": uuid4(),
+        "createdDate": now,
+        "createdBy": uuid4(),
+        "updatedDate": now,
+        "updatedBy": None,
+        "prompt": f"A watercolor painting of lighthouse number {i}",
+        "imageUrl": f"https://matchue-assets.s3.us-east-2.amazonaws.com/image-pool/{i}.webp",
+    }
+
+
+def rowsPerSecond(fn, rows: int) -> float:
+    startTime = time.perf_counter()
+    fn()
+    return rows / (time.perf_counter() - startTime)
+
+
+def benchmark(entityType, makeDocument, rows: int):
+    documents = [makeDocument(i) for i in range(rows)]
+
+    legacyEntities = [legacyFromDict(entityType, d) for d in documents]
+    entities = [entityType.fromDict(d) for d in documents]
+    for legacy, current in zip(legacyEntities, entities):
+        assert legacyToDict(legacy, True) == current.toDict(True)
+
+    results = {
+        "fromDict": (
+            rowsPerSecond(lambda: [legacyFromDict(entityType, d) for d in documents], rows),
+            rowsPerSecond(lambda: [entityType.fromDict(d) for d in documents], rows),
+        ),
+        "toDict": (
+            rowsPerSecond(lambda: [legacyToDict(e, True) for e in legacyEntities], rows),
+            rowsPerSecond(lambda: [e.toDict(True) for e in entities], rows),
+        ),
+    }
+
+    for name, (before, after) in results.items():
+        print(
+            f"{entityType.__name__:<16}{name:<10}"
+            f"before {before:>12,.0f} rows/s   after {after:>12,.0f} rows/s   ({after / before:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    benchmark(User, userDocument, rows)
+    benchmark(ImageGeneration, imageGenerationDocument, rows)
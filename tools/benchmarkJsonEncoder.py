@@ -0,0 +1,71 @@
+# Benchmarks serializing a list of entities for a response: the previous toDict(True) + Quart's default
+# JSON provider against the orjson encoder, which encodes the entities directly.
+# Run from the project root: python tools/benchmarkJsonEncoder.py [rows]
+
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from quart import Quart
+from quart.json.provider import DefaultJSONProvider
+
+from domain.imageGenerations.imageGeneration import ImageGeneration
+from domain.utility.jsonEncoder import encodeJson
+
+
+def makeImageGenerations(rows: int) -> list[ImageGeneration]:
+    start = datetime.utcnow()
+    imageGenerations = []
+    for i in range(rows):
+        imageGeneration = ImageGeneration(
+            f"A watercolor painting of lighthouse number {i}",
+            f"https://matchue-assets.s3.us-east-2.amazonaws.com/image-pool/{i}.webp",
+        )
+        imageGeneration.createdDate = start - timedelta(seconds=i)
+        imageGeneration.createdBy = uuid4()
+        imageGenerations.append(imageGeneration)
+    return imageGenerations
+
+
+def timeInterleaved(before, after, repeat: int) -> tuple[float, float, float]:
+    # Runs alternate so both sides see the same machine noise; medians of the times and the
+    # per-round ratios, since a single best run swings a lot on shared machines.
+    beforeTimes, afterTimes = [], []
+    for _ in range(repeat):
+        for fn, times in ((before, beforeTimes), (after, afterTimes)):
+            startTime = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - startTime)
+    ratios = [b / a for b, a in zip(beforeTimes, afterTimes)]
+    return statistics.median(beforeTimes), statistics.median(afterTimes), statistics.median(ratios)
+
+
+def benchmark(rows: int, repeat: int = 21):
+    app = Quart("benchmark")
+    defaultProvider = DefaultJSONProvider(app)
+    imageGenerations = makeImageGenerations(rows)
+
+    def before() -> bytes:
+        return defaultProvider.dumps([e.toDict(True) for e in imageGenerations]).encode("utf-8")
+
+    def after() -> bytes:
+        # What OrjsonProvider.response puts in the body
+        return encodeJson(imageGenerations)
+
+    assert json.loads(before()) == json.loads(after())
+
+    beforeTime, afterTime, speedup = timeInterleaved(before, after, repeat)
+    print(
+        f"{rows:,} ImageGeneration   before {rows / beforeTime:>12,.0f} rows/s   after {rows / afterTime:>12,.0f} rows/s   ({speedup:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    benchmark(rows)
@@ -0,0 +1,92 @@
+# Benchmarks a timespan scan read through the regular cursor against the raw BSON batch path,
+# with and without a projection. Needs a running Mongo; seeds and drops its own collection.
+# Run from the project root: python tools/benchmarkRawBson.py [rows]
+
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from domain.abstractEntity.projection import Projection
+from domain.imageGenerations.imageGeneration import ImageGeneration
+from persistence.dbClient import DatabaseClient, getDb
+from persistence.abstractEntity.queries.getByTimespanQuery import GetByTimespanQuery
+
+
+class BenchmarkImageGeneration(ImageGeneration):
+    # Lives in its own collection so the benchmark never touches real data. Not a dataclass of its
+    # own, that would replace ImageGeneration's constructor with one taking every field.
+    pass
+
+
+async def seed(rows: int) -> tuple[datetime, datetime]:
+    end = datetime.utcnow()
+    documents = []
+    for i in range(rows):
+        imageGeneration = BenchmarkImageGeneration(
+            f"A watercolor painting of lighthouse number {i}",
+            f"https://matchue-assets.s3.us-east-2.amazonaws.com/image-pool/{i}.webp",
+        )
+        imageGeneration.createdDate = end - timedelta(seconds=i)
+        imageGeneration.createdBy = uuid4()
+        documents.append(imageGeneration.toDict())
+    collection = getDb()[BenchmarkImageGeneration.getCollectionName()]
+    await collection.drop()
+    await collection.insert_many(documents)
+    await collection.create_index([("createdDate", -1)])
+    return end - timedelta(seconds=rows), end
+
+
+async def rowsPerSecond(fn, rows: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        startTime = time.perf_counter()
+        result = (await fn()).valueOrThrow()
+        best = min(best, time.perf_counter() - startTime)
+        assert len(result) == rows, len(result)
+    return rows / best
+
+
+async def benchmark(rows: int, repeat: int = 5):
+    startDate, endDate = await seed(rows)
+    try:
+        for label, projection in (("full", None), ("projected", Projection(["imageUrl", "createdDate"]))):
+
+            def read(rawBatches: bool):
+                return lambda: GetByTimespanQuery(
+                    BenchmarkImageGeneration, startDate, endDate, projection, rawBatches
+                )
+
+            before = (await read(False)()).valueOrThrow()
+            after = (await read(True)()).valueOrThrow()
+            assert [e.toDict() for e in before] == [e.toDict() for e in after]
+
+            beforeRate = await rowsPerSecond(read(False), rows, repeat)
+            afterRate = await rowsPerSecond(read(True), rows, repeat)
+            print(
+                f"{rows:,} {label:<10} cursor {beforeRate:>12,.0f} rows/s   raw batches {afterRate:>12,.0f} rows/s   ({afterRate / beforeRate:.1f}x)"
+            )
+    finally:
+        await getDb()[BenchmarkImageGeneration.getCollectionName()].drop()
+
+
+async def main(rows: int) -> int:
+    try:
+        await DatabaseClient.connect()
+    except Exception as e:
+        print(f"Could not connect to Mongo: {e}")
+        return 1
+    try:
+        await benchmark(rows)
+        return 0
+    finally:
+        DatabaseClient.close()
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    sys.exit(asyncio.run(main(rows)))
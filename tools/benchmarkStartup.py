@@ -0,0 +1,59 @@
+# Measures cold start: importing the app and serving its first request, each in a fresh interpreter,
+# and lists which of the heavy SDKs got imported along the way.
+# Run from the project root: python tools/benchmarkStartup.py [runs]
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ("openai", "pydantic", "aioboto3", "boto3", "PIL", "watchtower")
+
+# Runs in the child interpreter; the first request needs no database.
+CHILD = f"""
+import asyncio, json, sys, time
+sys.path.insert(0, {ROOT!r})
+start = time.perf_counter()
+from app import app
+imported = time.perf_counter()
+
+async def firstRequest():
+    from quart_jwt_extended import create_access_token
+    async with app.app_context():
+        token = create_access_token(identity={{"id": "00000000-0000-0000-0000-000000000000", "roles": []}})
+    response = await app.test_client().get(
+        "/image-generations/template", headers={{"Authorization": "Bearer " + token}}
+    )
+    assert response.status_code == 200, response.status_code
+
+asyncio.run(firstRequest())
+served = time.perf_counter()
+print(json.dumps({{
+    "importMs": (imported - start) * 1000,
+    "firstRequestMs": (served - imported) * 1000,
+    "heavyModules": [m for m in {HEAVY_MODULES!r} if m in sys.modules],
+}}))
+"""
+
+
+def run() -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def benchmark(runs: int):
+    results = [run() for _ in range(runs)]
+    importMs = statistics.median(r["importMs"] for r in results)
+    firstRequestMs = statistics.median(r["firstRequestMs"] for r in results)
+    print(f"import app        {importMs:>8.1f} ms (median of {runs})")
+    print(f"first request     {firstRequestMs:>8.1f} ms")
+    print(f"total             {importMs + firstRequestMs:>8.1f} ms")
+    print(f"heavy SDKs loaded {', '.join(results[-1]['heavyModules']) or 'none'}")
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,24 @@
+# Writes the route registry consumed by generatePostman.py and generateTypescriptApi.py.
+# The app no longer writes it on import; run this after changing routes.
+# Run from the project root: python tools/exportRegistry.py [path]
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from quart import Quart
+
+from api.routing import addRoutes, routeRegistry
+
+
+def exportRegistry(path: str):
+    controllers = addRoutes(Quart("registry"))
+    with open(path, "w") as f:
+        f.write(json.dumps(routeRegistry(controllers), indent=4))
+    print(f"Wrote {sum(len(c.routeRegistry) for c in controllers)} routes to {path}")
+
+
+if __name__ == "__main__":
+    exportRegistry(sys.argv[1] if len(sys.argv) > 1 else "registry.json")
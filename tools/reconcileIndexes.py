@@ -0,0 +1,52 @@
+# Reconciles the indexes declared on each entity with the ones in Mongo, rebuilding any whose
+# options changed, and optionally explains every known query shape, failing if any of them still
+# needs a collection scan. Rebuilding drops the old index first, so run this once per deploy, not
+# from every worker.
+# Run from the project root: python tools/reconcileIndexes.py [--drop-undeclared] [--explain]
+
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from persistence.dbClient import DatabaseClient
+from services.indexes.indexService import IndexService
+
+
+async def main(dropUndeclared: bool, explain: bool) -> int:
+    await DatabaseClient.connect()
+    try:
+        return await reconcile(dropUndeclared, explain)
+    finally:
+        DatabaseClient.close()
+
+
+async def reconcile(dropUndeclared: bool, explain: bool) -> int:
+    reconciliations = (await IndexService.reconcileAll(dropUndeclared, rebuildChanged=True)).valueOrThrow()
+    for reconciliation in reconciliations:
+        print(
+            f"{reconciliation.collectionName}: created {reconciliation.created or 'none'}, dropped {reconciliation.dropped or 'none'}"
+        )
+
+    if not explain:
+        return 0
+
+    explanations = (await IndexService.explainAll()).valueOrThrow()
+    failures = 0
+    for explanation in explanations:
+        status = "COLLSCAN" if explanation.usesCollectionScan else "ok"
+        print(
+            f"[{status}] {explanation.collectionName} {explanation.queryShape.filter} sort={explanation.queryShape.sort}: {' <- '.join(explanation.stages)}"
+        )
+        failures += explanation.usesCollectionScan
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--drop-undeclared", action="store_true")
+    parser.add_argument("--explain", action="store_true")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.drop_undeclared, args.explain)))